@@ -0,0 +1,79 @@
+# src/data/managers/cache.py
+
+import logging
+import os
+from typing import Any, Awaitable, Callable, Optional
+
+import orjson
+import redis.asyncio as aioredis
+from fastapi.encoders import jsonable_encoder
+
+logger = logging.getLogger(__name__)
+
+# Fail fast to the uncached path when Redis is unreachable
+REDIS_SOCKET_TIMEOUT = 0.5
+
+class CacheManager:
+    """Redis-backed TTL cache for hot read endpoints"""
+
+    def __init__(self, url: Optional[str] = None):
+        self.url = url or os.getenv('REDIS_URL', 'redis://redis:6379/0')
+        self._client: Optional[aioredis.Redis] = None
+
+    def _get_client(self) -> aioredis.Redis:
+        """Get the Redis client, creating it on first use"""
+        if self._client is None:
+            self._client = aioredis.from_url(
+                self.url,
+                socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+                socket_timeout=REDIS_SOCKET_TIMEOUT
+            )
+        return self._client
+
+    async def get_or_set(
+        self,
+        key: str,
+        ttl: int,
+        factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value for key, or compute and store it for ttl seconds.
+
+        Results carrying an ``"error"`` key are returned but not cached, so
+        one upstream failure is not served for the whole TTL.
+        """
+        client = self._get_client()
+
+        try:
+            cached = await client.get(key)
+            if cached is not None:
+                return orjson.loads(cached)
+        except Exception as e:
+            logger.warning("Cache read failed for %s: %s", key, e)
+
+        result = await factory()
+        if isinstance(result, dict) and "error" in result:
+            return result
+
+        try:
+            # Encode the way FastAPI renders the uncached response, so a hit
+            # has the same shape as a miss (ISO datetimes, Decimals as floats)
+            await client.setex(key, ttl, orjson.dumps(jsonable_encoder(result)))
+        except Exception as e:
+            logger.warning("Cache write failed for %s: %s", key, e)
+
+        return result
+
+    async def invalidate(self, *keys: str) -> None:
+        """Drop cached values"""
+        if not keys:
+            return
+        try:
+            await self._get_client().delete(*keys)
+        except Exception as e:
+            logger.warning("Cache invalidation failed for %s: %s", keys, e)
+
+    async def close(self) -> None:
+        """Close the Redis connection"""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
@@ -373,6 +373,37 @@ class StrategyRepository(BaseRepository[StrategyConfig]):
         })
         return result is not None
     
+    async def get_owned_ids(self, strategy_ids: List[str], user_id: str) -> List[str]:
+        """Return the ids from strategy_ids that exist and belong to user_id"""
+        if not strategy_ids:
+            return []
+        
+        collection = await self.get_collection()
+        cursor = collection.find(
+            {
+                "_id": {"$in": [PyObjectId(sid) for sid in strategy_ids]},
+                "user_id": PyObjectId(user_id)
+            },
+            {"_id": 1}
+        )
+        return [str(doc["_id"]) async for doc in cursor]
+    
+    async def activate_many(self, strategy_ids: List[str], user_id: str = None) -> int:
+        """Activate several strategies in a single update; returns number modified"""
+        if not strategy_ids:
+            return 0
+        
+        filter_dict = {"_id": {"$in": [PyObjectId(sid) for sid in strategy_ids]}}
+        if user_id:
+            filter_dict["user_id"] = PyObjectId(user_id)
+        
+        collection = await self.get_collection()
+        result = await collection.update_many(
+            filter_dict,
+            {"$set": {"active": True, "updated_at": datetime.now(timezone.utc)}}
+        )
+        return result.modified_count
+    
     async def increment_downloads(self, strategy_id: str) -> bool:
         """Increment download count for marketplace strategy"""
         strategy = await self.get_by_id(strategy_id)
@@ -10,7 +10,6 @@ from pathlib import Path
 
 # Import colorama for colored output
 from colorama import init, Fore, Back, Style
-import pandas as pd
 
 # Import core components
 from src.core.engine.trading_engine import TradingEngine
@@ -807,20 +806,16 @@ def balance(exchange: str):
                 cli_instance.print_warning("No balance data available")
                 return
             
-            total_value = 0
+            holdings = {currency: amount for currency, amount in balance_data.items() if amount > 0}
             
-            for currency, amount in balance_data.items():
-                if amount > 0:
-                    # Get USD value (simplified)
-                    if currency == 'USDT':
-                        usd_value = amount
-                    else:
-                        usd_value = amount * 50000  # Simplified conversion
-                    
-                    total_value += usd_value
-                    
-                    click.echo(f"{Fore.CYAN}{currency}:{Style.RESET_ALL} {amount:,.4f} "
-                              f"({cli_instance.format_currency(usd_value)})")
+            # Get USD values (simplified conversion for non-USDT assets)
+            prices = {currency: 1.0 if currency == 'USDT' else 50000.0 for currency in holdings}
+            usd_values = {currency: amount * prices[currency] for currency, amount in holdings.items()}
+            total_value = sum(usd_values.values())
+            
+            for currency, amount in holdings.items():
+                click.echo(f"{Fore.CYAN}{currency}:{Style.RESET_ALL} {amount:,.4f} "
+                          f"({cli_instance.format_currency(usd_values[currency])})")
             
             click.echo(f"\n{Fore.GREEN}Total Value: {cli_instance.format_currency(total_value)}{Style.RESET_ALL}")
             
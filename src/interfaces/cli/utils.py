@@ -1,14 +1,49 @@
 # src/interfaces/cli/utils.py
 
+import asyncio
+import itertools
 import json
 import csv
+import re
+import sys
+import time
+from contextlib import asynccontextmanager
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from pathlib import Path
-import pandas as pd
 from colorama import Fore, Back, Style
 import click
 
+_RESET = Style.RESET_ALL
+_POSITIVE = Fore.GREEN
+_NEGATIVE = Fore.RED
+
+_STATUS_MAP = {
+    'active': f"{Fore.GREEN}🟢 Active{_RESET}",
+    'inactive': f"{Fore.RED}🔴 Inactive{_RESET}",
+    'running': f"{Fore.GREEN}🟢 Running{_RESET}",
+    'stopped': f"{Fore.RED}🛑 Stopped{_RESET}",
+    'error': f"{Fore.RED}❌ Error{_RESET}",
+    'warning': f"{Fore.YELLOW}⚠️ Warning{_RESET}",
+    'success': f"{Fore.GREEN}✅ Success{_RESET}",
+    'pending': f"{Fore.YELLOW}⏳ Pending{_RESET}",
+    'completed': f"{Fore.GREEN}✅ Completed{_RESET}",
+    'cancelled': f"{Fore.RED}❌ Cancelled{_RESET}"
+}
+
+_VALID_TIMEFRAMES = frozenset(('1m', '5m', '15m', '30m', '1h', '4h', '8h', '1d', '1w'))
+_BAR_LENGTH = 40
+_FULL_BAR = '█' * _BAR_LENGTH
+_EMPTY_BAR = '-' * _BAR_LENGTH
+_REDRAW_INTERVAL = 0.033  # ~30 redraws per second
+
+_SPINNER_FRAMES = ('⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏')
+_SPINNER_INTERVAL = 0.1
+
+# ccxt unified symbols: BASE/QUOTE with an optional :SETTLE suffix for derivatives
+# (e.g. BTC/USDT:USDT); bases such as 1000-PEPE may carry '-', '_' or '.'
+_SYMBOL_RE = re.compile(r'^[A-Za-z0-9._-]+/[A-Za-z0-9._-]+(?::[A-Za-z0-9._-]+)?$')
+
 class CLIFormatter:
     """Utility class for CLI formatting and display"""
     
@@ -21,29 +56,27 @@ class CLIFormatter:
         if not headers:
             headers = list(data[0].keys())
         
-        # Calculate column widths
-        widths = {}
-        for header in headers:
-            widths[header] = max(
-                len(str(header)),
-                max(len(str(row.get(header, ''))) for row in data)
-            )
+        # Stringify every cell once and collect column widths in one pass
+        rendered = [[str(row.get(header, '')) for header in headers] for row in data]
+        widths = [len(str(header)) for header in headers]
+        for cells in rendered:
+            for i, cell in enumerate(cells):
+                if len(cell) > widths[i]:
+                    widths[i] = len(cell)
         
         # Create table
         table_lines = []
         
         # Header
-        header_line = " | ".join(f"{header:<{widths[header]}}" for header in headers)
-        table_lines.append(f"{Fore.CYAN}{header_line}{Style.RESET_ALL}")
+        header_line = " | ".join(str(header).ljust(width) for header, width in zip(headers, widths))
+        table_lines.append(f"{Fore.CYAN}{header_line}{_RESET}")
         
         # Separator
-        separator = "-+-".join("-" * widths[header] for header in headers)
-        table_lines.append(separator)
+        table_lines.append("-+-".join("-" * width for width in widths))
         
         # Data rows
-        for row in data:
-            row_line = " | ".join(f"{str(row.get(header, '')):<{widths[header]}}" for header in headers)
-            table_lines.append(row_line)
+        for cells in rendered:
+            table_lines.append(" | ".join(cell.ljust(width) for cell, width in zip(cells, widths)))
         
         return "\n".join(table_lines)
     
@@ -58,9 +91,9 @@ class CLIFormatter:
         """Format percentage with color coding"""
         formatted = f"{value:.{precision}f}%"
         if value > 0:
-            return f"{Fore.GREEN}+{formatted}{Style.RESET_ALL}"
+            return "".join((_POSITIVE, "+", formatted, _RESET))
         elif value < 0:
-            return f"{Fore.RED}{formatted}{Style.RESET_ALL}"
+            return "".join((_NEGATIVE, formatted, _RESET))
         else:
             return formatted
     
@@ -71,28 +104,16 @@ class CLIFormatter:
         formatted = f"{symbol}{abs(amount):,.{precision}f}"
         
         if amount > 0:
-            return f"{Fore.GREEN}{formatted}{Style.RESET_ALL}"
+            return "".join((_POSITIVE, formatted, _RESET))
         elif amount < 0:
-            return f"{Fore.RED}-{formatted}{Style.RESET_ALL}"
+            return "".join((_NEGATIVE, "-", formatted, _RESET))
         else:
             return formatted
     
     @staticmethod
     def format_status(status: str) -> str:
         """Format status with appropriate icons and colors"""
-        status_map = {
-            'active': f"{Fore.GREEN}🟢 Active{Style.RESET_ALL}",
-            'inactive': f"{Fore.RED}🔴 Inactive{Style.RESET_ALL}",
-            'running': f"{Fore.GREEN}🟢 Running{Style.RESET_ALL}",
-            'stopped': f"{Fore.RED}🛑 Stopped{Style.RESET_ALL}",
-            'error': f"{Fore.RED}❌ Error{Style.RESET_ALL}",
-            'warning': f"{Fore.YELLOW}⚠️ Warning{Style.RESET_ALL}",
-            'success': f"{Fore.GREEN}✅ Success{Style.RESET_ALL}",
-            'pending': f"{Fore.YELLOW}⏳ Pending{Style.RESET_ALL}",
-            'completed': f"{Fore.GREEN}✅ Completed{Style.RESET_ALL}",
-            'cancelled': f"{Fore.RED}❌ Cancelled{Style.RESET_ALL}"
-        }
-        return status_map.get(status.lower(), status)
+        return _STATUS_MAP.get(status.lower(), status)
 
 class CLIExporter:
     """Utility class for exporting CLI data"""
@@ -104,8 +125,13 @@ class CLIExporter:
             if not data:
                 return False
             
-            df = pd.DataFrame(data)
-            df.to_csv(filename, index=False)
+            # Union of keys across rows, in first-seen order
+            fieldnames = list(dict.fromkeys(key for row in data for key in row))
+            
+            with open(filename, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(data)
             return True
         except Exception:
             return False
@@ -124,35 +150,40 @@ class CLIExporter:
     def export_backtest_report(results: Dict[str, Any], filename: str) -> bool:
         """Export backtest results as formatted report"""
         try:
-            with open(filename, 'w') as f:
-                f.write("TRADING BOT BACKTEST REPORT\n")
-                f.write("=" * 50 + "\n\n")
-                
-                f.write(f"Strategy: {results.get('strategy_name', 'Unknown')}\n")
-                f.write(f"Symbol: {results.get('symbol', 'Unknown')}\n")
-                f.write(f"Timeframe: {results.get('timeframe', 'Unknown')}\n")
-                f.write(f"Start Date: {results.get('start_date', 'Unknown')}\n")
-                f.write(f"End Date: {results.get('end_date', 'Unknown')}\n\n")
-                
-                f.write("PERFORMANCE METRICS\n")
-                f.write("-" * 20 + "\n")
-                f.write(f"Initial Balance: ${results.get('initial_balance', 0):,.2f}\n")
-                f.write(f"Final Balance: ${results.get('final_balance', 0):,.2f}\n")
-                f.write(f"Total Return: {results.get('total_return_pct', 0):.2f}%\n")
-                f.write(f"Total Trades: {results.get('total_trades', 0)}\n")
-                f.write(f"Win Rate: {results.get('win_rate', 0):.2f}%\n")
-                f.write(f"Sharpe Ratio: {results.get('sharpe_ratio', 0):.2f}\n")
-                f.write(f"Max Drawdown: {results.get('max_drawdown', 0):.2f}%\n\n")
-                
-                if 'trades_log' in results:
-                    f.write("TRADE LOG\n")
-                    f.write("-" * 10 + "\n")
-                    for trade in results['trades_log']:
-                        f.write(f"{trade.get('timestamp', '')} - "
-                               f"{trade.get('side', '').upper()} "
-                               f"{trade.get('amount', 0)} {trade.get('symbol', '')} "
-                               f"@ ${trade.get('price', 0):.2f}\n")
-                
+            parts = [
+                "TRADING BOT BACKTEST REPORT\n",
+                "=" * 50 + "\n\n",
+                f"Strategy: {results.get('strategy_name', 'Unknown')}\n",
+                f"Symbol: {results.get('symbol', 'Unknown')}\n",
+                f"Timeframe: {results.get('timeframe', 'Unknown')}\n",
+                f"Start Date: {results.get('start_date', 'Unknown')}\n",
+                f"End Date: {results.get('end_date', 'Unknown')}\n\n",
+                "PERFORMANCE METRICS\n",
+                "-" * 20 + "\n",
+                f"Initial Balance: ${results.get('initial_balance', 0):,.2f}\n",
+                f"Final Balance: ${results.get('final_balance', 0):,.2f}\n",
+                f"Total Return: {results.get('total_return_pct', 0):.2f}%\n",
+                f"Total Trades: {results.get('total_trades', 0)}\n",
+                f"Win Rate: {results.get('win_rate', 0):.2f}%\n",
+                f"Sharpe Ratio: {results.get('sharpe_ratio', 0):.2f}\n",
+                f"Max Drawdown: {results.get('max_drawdown', 0):.2f}%\n\n",
+            ]
+            
+            if 'trades_log' in results:
+                parts.append("TRADE LOG\n")
+                parts.append("-" * 10 + "\n")
+                parts.extend(
+                    f"{trade.get('timestamp', '')} - "
+                    f"{trade.get('side', '').upper()} "
+                    f"{trade.get('amount', 0)} {trade.get('symbol', '')} "
+                    f"@ ${trade.get('price', 0):.2f}\n"
+                    for trade in results['trades_log']
+                )
+            
+            # Single buffered write for the whole report
+            with open(filename, 'w', buffering=1 << 20) as f:
+                f.write("".join(parts))
+            
             return True
         except Exception:
             return False
@@ -165,7 +196,7 @@ class CLIValidator:
         """Validate trading symbol format"""
         if not symbol:
             return False
-        return '/' in symbol and len(symbol.split('/')) == 2
+        return _SYMBOL_RE.match(symbol) is not None
     
     @staticmethod
     def validate_amount(amount: str) -> tuple[bool, float]:
@@ -188,14 +219,16 @@ class CLIValidator:
     @staticmethod
     def validate_timeframe(timeframe: str) -> bool:
         """Validate timeframe format"""
-        valid_timeframes = ['1m', '5m', '15m', '30m', '1h', '4h', '8h', '1d', '1w']
-        return timeframe in valid_timeframes
+        return timeframe in _VALID_TIMEFRAMES
     
     @staticmethod
     def validate_date(date_str: str) -> tuple[bool, Optional[datetime]]:
         """Validate date string format"""
+        # fromisoformat accepts other ISO 8601 forms too; only allow YYYY-MM-DD
+        if len(date_str) != 10 or date_str[4] != '-' or date_str[7] != '-':
+            return False, None
         try:
-            date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+            date_obj = datetime.fromisoformat(date_str)
             return True, date_obj
         except ValueError:
             return False, None
@@ -207,6 +240,7 @@ class CLIProgress:
         self.total = total
         self.current = 0
         self.description = description
+        self._last_draw = 0.0
     
     def update(self, increment: int = 1):
         """Update progress"""
@@ -218,17 +252,22 @@ class CLIProgress:
         if self.total == 0:
             return
         
-        percentage = (self.current / self.total) * 100
-        bar_length = 40
-        filled_length = int(bar_length * self.current / self.total)
+        done = self.current >= self.total
+        
+        # Throttle redraws; always draw the final state
+        now = time.monotonic()
+        if not done and now - self._last_draw < _REDRAW_INTERVAL:
+            return
+        self._last_draw = now
         
-        bar = '█' * filled_length + '-' * (bar_length - filled_length)
+        percentage = (self.current / self.total) * 100
+        filled_length = min(int(_BAR_LENGTH * self.current / self.total), _BAR_LENGTH)
         
-        click.echo(f"\r{self.description}: |{bar}| {percentage:.1f}% "
-                  f"({self.current}/{self.total})", nl=False)
+        bar = _FULL_BAR[:filled_length] + _EMPTY_BAR[filled_length:]
         
-        if self.current >= self.total:
-            click.echo()  # New line when complete
+        sys.stdout.write(f"\r{self.description}: |{bar}| {percentage:.1f}% "
+                         f"({self.current}/{self.total})" + ("\n" if done else ""))
+        sys.stdout.flush()
 
 class CLIColorScheme:
     """Color scheme constants for CLI"""
@@ -266,27 +305,31 @@ def confirm_action(message: str, default: bool = False) -> bool:
     
     return response.lower() in ['y', 'yes', 'true', '1']
 
-def show_spinner(message: str):
-    """Show a simple spinner for long operations"""
-    import itertools
-    import time
-    import threading
-    
-    spinner = itertools.cycle(['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏'])
-    
-    def spin():
-        while getattr(spin, 'running', True):
-            click.echo(f"\r{next(spinner)} {message}", nl=False)
-            time.sleep(0.1)
-    
-    thread = threading.Thread(target=spin)
-    thread.daemon = True
-    thread.start()
-    
-    return thread
+async def _spin(message: str, stop_event: asyncio.Event):
+    """Redraw spinner frames until stop_event is set"""
+    for frame in itertools.cycle(_SPINNER_FRAMES):
+        sys.stdout.write(f"\r{frame} {message}")
+        sys.stdout.flush()
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=_SPINNER_INTERVAL)
+            return
+        except asyncio.TimeoutError:
+            pass
 
-def stop_spinner(thread):
-    """Stop the spinner"""
-    if hasattr(thread, 'running'):
-        thread.running = False
-    click.echo("\r" + " " * 50 + "\r", nl=False)  # Clear spinner line
+@asynccontextmanager
+async def spinner(message: str):
+    """Show a spinner while the wrapped async block runs
+    
+    Usage:
+        async with spinner("Loading balance"):
+            await work()
+    """
+    stop_event = asyncio.Event()
+    task = asyncio.create_task(_spin(message, stop_event))
+    try:
+        yield
+    finally:
+        stop_event.set()
+        await task
+        sys.stdout.write("\r" + " " * (len(message) + 2) + "\r")  # Clear spinner line
+        sys.stdout.flush()
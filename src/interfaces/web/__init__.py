@@ -1,4 +1,6 @@
-"""Web interface module."""
-from .app import create_app
+"""Web interface module.
 
-__all__ = ['create_app']
+The FastAPI application lives in ``app`` and is imported on demand
+(``from interfaces.web.app import app, run_web_app``) so importing this
+package stays cheap.
+"""
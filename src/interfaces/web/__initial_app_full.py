@@ -6,21 +6,24 @@ Connects frontend to actual trading engine and ccxt-gateway
 """
 
 import asyncio
+import hashlib
 import logging
 import os
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 
 from fastapi import FastAPI, HTTPException, Depends, Request, WebSocket, WebSocketDisconnect
-from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
+from bson import ObjectId
+from jinja2 import FileSystemBytecodeCache, TemplateNotFound
 
 # Import our modules
 from .trading_api import router as trading_router, init_trading_api
 from .auth import auth_router, get_current_user, create_access_token
+from .static_files import InMemoryStaticFiles
 from ...core.trading_engine import TradingEngine
 from ...clients.ccxt_client import CCXTClient
 from ...clients.quickchart_client import QuickChartClient
@@ -34,11 +37,13 @@ from ...database.repositories import (
 from ...utils.trading_helpers import (
     get_portfolio_summary,
     get_market_overview,
+    compute_usd_values,
     calculate_risk_metrics,
     format_currency,
     format_percentage
 )
 from ...core.config_manager import ConfigManager
+from ...data.managers.cache import CacheManager
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -48,21 +53,42 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Light Trading Bot",
     description="Advanced trading bot with backtesting, paper trading, and live trading",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
-# CORS middleware
+# CORS middleware - explicit origins (comma-separated CORS_ORIGINS env var);
+# a wildcard origin is rejected by browsers when credentials are allowed
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:5000").split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify exact origins
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,  # Let browsers cache preflight responses for 24h
 )
 
 # Static files and templates
-app.mount("/static", StaticFiles(directory="src/interfaces/web/static"), name="static")
-templates = Jinja2Templates(directory="src/interfaces/web/templates")
+app.mount("/static", InMemoryStaticFiles(directory="src/interfaces/web/static"), name="static")
+TEMPLATES_DIR = "src/interfaces/web/templates"
+# Compiled templates are kept in memory and on disk; restart to pick up template edits
+JINJA_CACHE_DIR = os.getenv("JINJA_CACHE_DIR", "/tmp/jinja_cache")
+os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+templates = Jinja2Templates(
+    directory=TEMPLATES_DIR,
+    auto_reload=False,
+    cache_size=400,
+    bytecode_cache=FileSystemBytecodeCache(JINJA_CACHE_DIR)
+)
+
+# Pages without per-user data may be cached by browsers and proxies
+STATIC_PAGE_CACHE_CONTROL = "public, max-age=60"
 
 # Global instances
 trading_engine: Optional[TradingEngine] = None
@@ -73,25 +99,69 @@ config_manager: Optional[ConfigManager] = None
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
 
     async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except:
-                # Remove dead connections
-                self.active_connections.remove(connection)
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(message) for connection in connections),
+            return_exceptions=True
+        )
+        # Drop dead connections without mutating the set mid-iteration
+        dead = {c for c, r in zip(connections, results) if isinstance(r, Exception)}
+        if dead:
+            self.active_connections -= dead
 
 manager = ConnectionManager()
 
+# Symbols pushed to websocket clients, and push interval (seconds)
+TICKER_SYMBOLS = ('BTC/USDT', 'ETH/USDT')
+TICKER_INTERVAL = 5
+
+async def _ticker_broadcaster():
+    """Fetch tickers once per tick and broadcast them to all websocket clients"""
+    while True:
+        try:
+            if ccxt_client and manager.active_connections:
+                tickers = await asyncio.gather(
+                    *(ccxt_client.get_ticker(symbol, 'kucoin') for symbol in TICKER_SYMBOLS),
+                    return_exceptions=True
+                )
+                for symbol, ticker in zip(TICKER_SYMBOLS, tickers):
+                    if not isinstance(ticker, Exception):
+                        await manager.broadcast(f"price_update:{symbol}:{ticker['last']}")
+        except Exception as e:
+            logger.error(f"Ticker broadcast error: {str(e)}")
+        
+        await asyncio.sleep(TICKER_INTERVAL)
+
+# Assets already quoted in USD
+STABLE_ASSETS = frozenset(('USD', 'USDT', 'USDC'))
+
+# Cache TTLs (seconds) for endpoints polled by the dashboard
+STATUS_CACHE_TTL = 2
+DASHBOARD_CACHE_TTL = 5
+BALANCE_CACHE_TTL = 10
+
+cache = CacheManager()
+
+# Repository dependencies - instances are created once at startup
+def get_trade_repo(request: Request) -> TradeRepository:
+    return request.app.state.trade_repo
+
+def get_strategy_repo(request: Request) -> StrategyRepository:
+    return request.app.state.strategy_repo
+
+def get_exchange_repo(request: Request) -> ExchangeRepository:
+    return request.app.state.exchange_repo
+
 # Include routers
 app.include_router(auth_router, prefix="/auth", tags=["authentication"])
 app.include_router(trading_router)
@@ -112,6 +182,11 @@ async def startup_event():
         db = DatabaseConnection()
         await db.connect()
         
+        # Initialize repositories shared by all requests
+        app.state.trade_repo = TradeRepository()
+        app.state.strategy_repo = StrategyRepository()
+        app.state.exchange_repo = ExchangeRepository()
+        
         # Initialize clients
         ccxt_client = CCXTClient()
         quickchart_client = QuickChartClient()
@@ -123,6 +198,9 @@ async def startup_event():
         # Initialize trading API with clients
         init_trading_api(trading_engine, ccxt_client)
         
+        # Single producer for websocket price updates
+        app.state.ticker_task = asyncio.create_task(_ticker_broadcaster())
+        
         logger.info("Trading bot web application started successfully!")
         
     except Exception as e:
@@ -135,17 +213,43 @@ async def shutdown_event():
     global trading_engine
     
     try:
+        ticker_task = getattr(app.state, "ticker_task", None)
+        if ticker_task:
+            ticker_task.cancel()
         if trading_engine:
             await trading_engine.stop()
+        await cache.close()
         logger.info("Trading bot web application shutdown complete")
     except Exception as e:
         logger.error(f"Error during shutdown: {str(e)}")
 
+# template name -> (html, etag); templates are not auto-reloaded, so neither is this
+_static_page_cache: Dict[str, Tuple[str, str]] = {}
+
+def static_page_response(request: Request, name: str) -> Response:
+    """Serve a data-free template with caching headers and If-None-Match support"""
+    cached = _static_page_cache.get(name)
+    if cached is None:
+        # Output does not depend on the request, so render once
+        try:
+            html = templates.get_template(name).render({"request": request})
+        except TemplateNotFound:
+            logger.error(f"Template not found: {name}")
+            raise HTTPException(status_code=404, detail="Page not found")
+        cached = (html, f'"{hashlib.md5(html.encode()).hexdigest()}"')
+        _static_page_cache[name] = cached
+    html, etag = cached
+    
+    headers = {"Cache-Control": STATIC_PAGE_CACHE_CONTROL, "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(html, headers=headers)
+
 # Authentication routes
 @app.get("/login", response_class=HTMLResponse)
 async def login_page(request: Request):
     """Login page"""
-    return templates.TemplateResponse("login.html", {"request": request})
+    return static_page_response(request, "login.html")
 
 # Main dashboard route  
 @app.get("/", response_class=HTMLResponse)
@@ -160,43 +264,52 @@ async def dashboard(request: Request):
 @app.get("/trading", response_class=HTMLResponse)
 async def trading_page(request: Request):
     """Trading interface page"""
-    return templates.TemplateResponse("trading.html", {"request": request})
+    return static_page_response(request, "trading.html")
 
 @app.get("/strategies", response_class=HTMLResponse)
 async def strategies_page(request: Request):
     """Strategy management page"""
-    return templates.TemplateResponse("strategies.html", {"request": request})
+    return static_page_response(request, "strategies.html")
 
 @app.get("/backtesting", response_class=HTMLResponse)
 async def backtesting_page(request: Request):
     """Backtesting interface page"""
-    return templates.TemplateResponse("backtesting.html", {"request": request})
+    return static_page_response(request, "backtesting.html")
 
 @app.get("/settings", response_class=HTMLResponse)
 async def settings_page(request: Request):
     """Settings page"""
-    return templates.TemplateResponse("settings.html", {"request": request})
+    return static_page_response(request, "settings.html")
 
 # API Routes for Dashboard Data
 
 @app.get("/api/dashboard/summary")
-async def get_dashboard_summary(user = Depends(get_current_user)):
+async def get_dashboard_summary(
+    user = Depends(get_current_user),
+    trade_repo: TradeRepository = Depends(get_trade_repo)
+):
     """Get dashboard summary with real data"""
+    return await cache.get_or_set(
+        f"dash:{user.id}",
+        DASHBOARD_CACHE_TTL,
+        lambda: _build_dashboard_summary(user, trade_repo)
+    )
+
+async def _build_dashboard_summary(user, trade_repo: TradeRepository) -> Dict[str, Any]:
+    """Build the dashboard summary from exchange and database data"""
     try:
-        # Get portfolio summary
-        portfolio = await get_portfolio_summary(
-            user_id=str(user.id),
-            ccxt_client=ccxt_client,
-            exchange='kucoin'
-        )
-        
-        # Get market overview for popular symbols
         market_symbols = ['BTC/USDT', 'ETH/USDT', 'BNB/USDT', 'ADA/USDT']
-        market_data = await get_market_overview(market_symbols, ccxt_client)
         
-        # Get recent activity
-        trade_repo = TradeRepository()
-        recent_trades = await trade_repo.get_user_trades(user_id=str(user.id), limit=5)
+        # Portfolio, market overview and recent activity are independent
+        portfolio, market_data, recent_trades = await asyncio.gather(
+            get_portfolio_summary(
+                user_id=str(user.id),
+                ccxt_client=ccxt_client,
+                exchange='kucoin'
+            ),
+            get_market_overview(market_symbols, ccxt_client),
+            trade_repo.get_user_trades(user_id=str(user.id), limit=5)
+        )
         
         return {
             "portfolio": {
@@ -229,12 +342,24 @@ async def get_dashboard_summary(user = Depends(get_current_user)):
 @app.get("/api/portfolio/balance")
 async def get_portfolio_balance(
     exchange: str = 'kucoin',
-    user = Depends(get_current_user)
+    user = Depends(get_current_user),
+    exchange_repo: ExchangeRepository = Depends(get_exchange_repo)
 ):
     """Get real portfolio balance from exchange"""
+    return await cache.get_or_set(
+        f"balance:{user.id}:{exchange}",
+        BALANCE_CACHE_TTL,
+        lambda: _build_portfolio_balance(user, exchange, exchange_repo)
+    )
+
+async def _build_portfolio_balance(
+    user,
+    exchange: str,
+    exchange_repo: ExchangeRepository
+) -> Dict[str, Any]:
+    """Build the portfolio balance from the exchange"""
     try:
         # Get exchange configuration
-        exchange_repo = ExchangeRepository()
         user_exchange = await exchange_repo.get_by_user_and_name(str(user.id), exchange)
         
         if not user_exchange:
@@ -254,35 +379,49 @@ async def get_portfolio_balance(
         )
         
         # Process balance data
+        held = {
+            asset: asset_balance
+            for asset, asset_balance in balance.items()
+            if asset_balance.get('total', 0) > 0
+        }
+        
+        # Fetch USD prices for all non-stable assets concurrently
+        priced_assets = [asset for asset in held if asset not in STABLE_ASSETS]
+        tickers = await asyncio.gather(
+            *(ccxt_client.get_ticker(f"{asset}/USDT", exchange) for asset in priced_assets),
+            return_exceptions=True
+        )
+        prices = {asset: 1.0 for asset in held if asset in STABLE_ASSETS}
+        prices.update(
+            (asset, ticker['last'])
+            for asset, ticker in zip(priced_assets, tickers)
+            if not isinstance(ticker, Exception)
+        )
+        usd_values = compute_usd_values(
+            {asset: asset_balance['total'] for asset, asset_balance in held.items()},
+            prices
+        )
+        
         positions = []
         total_balance = 0
         used_balance = 0
         
-        for asset, asset_balance in balance.items():
-            if asset_balance.get('total', 0) > 0:
-                total = asset_balance['total']
-                free = asset_balance['free']
-                used = asset_balance['used']
-                
-                # Get USD value
-                usd_value = total
-                if asset not in ['USD', 'USDT', 'USDC']:
-                    try:
-                        ticker = await ccxt_client.get_ticker(f"{asset}/USDT", exchange)
-                        usd_value = total * ticker['last']
-                    except:
-                        usd_value = 0
-                
-                positions.append({
-                    'asset': asset,
-                    'total': total,
-                    'free': free,
-                    'used': used,
-                    'usd_value': usd_value
-                })
-                
-                total_balance += usd_value
-                used_balance += (used * usd_value / total) if total > 0 else 0
+        for asset, asset_balance in held.items():
+            total = asset_balance['total']
+            free = asset_balance['free']
+            used = asset_balance['used']
+            usd_value = usd_values[asset]
+            
+            positions.append({
+                'asset': asset,
+                'total': total,
+                'free': free,
+                'used': used,
+                'usd_value': usd_value
+            })
+            
+            total_balance += usd_value
+            used_balance += used * usd_value / total
         
         return {
             "total_balance": total_balance,
@@ -302,10 +441,12 @@ async def get_portfolio_balance(
         }
 
 @app.get("/api/strategies/active")
-async def get_active_strategies(user = Depends(get_current_user)):
+async def get_active_strategies(
+    user = Depends(get_current_user),
+    strategy_repo: StrategyRepository = Depends(get_strategy_repo)
+):
     """Get active strategies for user"""
     try:
-        strategy_repo = StrategyRepository()
         strategies = await strategy_repo.get_user_strategies(str(user.id), active_only=True)
         
         return [
@@ -330,23 +471,22 @@ async def get_active_strategies(user = Depends(get_current_user)):
 @app.post("/api/strategies/{strategy_id}/activate")
 async def activate_strategy(
     strategy_id: str,
-    user = Depends(get_current_user)
+    user = Depends(get_current_user),
+    strategy_repo: StrategyRepository = Depends(get_strategy_repo)
 ):
     """Activate a trading strategy"""
     try:
-        strategy_repo = StrategyRepository()
-        
         # Get strategy
         strategy = await strategy_repo.get_by_id(strategy_id)
         if not strategy or strategy.user_id != str(user.id):
             raise HTTPException(status_code=404, detail="Strategy not found")
         
-        # Activate strategy in trading engine
+        # Activate in trading engine and persist concurrently
+        updates = [strategy_repo.update(strategy_id, {"active": True})]
         if trading_engine:
-            await trading_engine.activate_strategy(strategy_id)
-        
-        # Update database
-        await strategy_repo.update(strategy_id, {"active": True})
+            updates.append(trading_engine.activate_strategy(strategy_id))
+        await asyncio.gather(*updates)
+        await cache.invalidate(f"dash:{user.id}", f"status:{user.id}")
         
         return {"success": True, "message": f"Strategy {strategy.name} activated"}
         
@@ -354,6 +494,32 @@ async def activate_strategy(
         logger.error(f"Error activating strategy: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/strategies/activate")
+async def activate_strategies(
+    strategy_ids: List[str],
+    user = Depends(get_current_user),
+    strategy_repo: StrategyRepository = Depends(get_strategy_repo)
+):
+    """Activate several of the caller's trading strategies with a single database write"""
+    invalid_ids = [sid for sid in strategy_ids if not ObjectId.is_valid(sid)]
+    if invalid_ids:
+        raise HTTPException(status_code=400, detail=f"Invalid strategy ids: {', '.join(invalid_ids)}")
+    
+    try:
+        # Only strategies that exist and belong to the caller reach the engine or the DB
+        owned_ids = await strategy_repo.get_owned_ids(strategy_ids, str(user.id))
+        updates = [strategy_repo.activate_many(owned_ids, user_id=str(user.id))]
+        if trading_engine:
+            updates.extend(trading_engine.activate_strategy(sid) for sid in owned_ids)
+        results = await asyncio.gather(*updates)
+        await cache.invalidate(f"dash:{user.id}", f"status:{user.id}")
+        
+        return {"success": True, "activated": results[0]}
+        
+    except Exception as e:
+        logger.error(f"Error activating strategies: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/api/bot/start")
 async def start_bot(
     mode: str = "paper",
@@ -363,6 +529,7 @@ async def start_bot(
     try:
         if trading_engine:
             await trading_engine.start(mode=mode)
+            await cache.invalidate(f"dash:{user.id}", f"status:{user.id}")
             return {"success": True, "message": f"Bot started in {mode} mode"}
         else:
             raise HTTPException(status_code=500, detail="Trading engine not available")
@@ -377,6 +544,7 @@ async def stop_bot(user = Depends(get_current_user)):
     try:
         if trading_engine:
             await trading_engine.stop()
+            await cache.invalidate(f"dash:{user.id}", f"status:{user.id}")
             return {"success": True, "message": "Bot stopped successfully"}
         else:
             raise HTTPException(status_code=500, detail="Trading engine not available")
@@ -388,6 +556,14 @@ async def stop_bot(user = Depends(get_current_user)):
 @app.get("/api/bot/status")
 async def get_bot_status(user = Depends(get_current_user)):
     """Get trading bot status"""
+    return await cache.get_or_set(
+        f"status:{user.id}",
+        STATUS_CACHE_TTL,
+        _build_bot_status
+    )
+
+async def _build_bot_status() -> Dict[str, Any]:
+    """Build the trading bot status from the engine"""
     try:
         if trading_engine:
             status = await trading_engine.get_status()
@@ -423,20 +599,9 @@ async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time updates"""
     await manager.connect(websocket)
     try:
+        # Price updates are pushed by _ticker_broadcaster; just wait for disconnect
         while True:
-            # Send periodic updates
-            if ccxt_client:
-                # Get market data for popular symbols
-                symbols = ['BTC/USDT', 'ETH/USDT']
-                for symbol in symbols:
-                    try:
-                        ticker = await ccxt_client.get_ticker(symbol, 'kucoin')
-                        await websocket.send_text(f"price_update:{symbol}:{ticker['last']}")
-                    except:
-                        pass
-            
-            await asyncio.sleep(5)  # Update every 5 seconds
-            
+            await websocket.receive_text()
     except WebSocketDisconnect:
         manager.disconnect(websocket)
     except Exception as e:
@@ -446,40 +611,63 @@ async def websocket_endpoint(websocket: WebSocket):
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "services": {
-            "trading_engine": trading_engine is not None,
-            "ccxt_client": ccxt_client is not None,
-            "quickchart_client": quickchart_client is not None
-        }
-    }
+    return ORJSONResponse(
+        content={
+            "status": "healthy",
+            "timestamp": datetime.utcnow(),
+            "services": {
+                "trading_engine": trading_engine is not None,
+                "ccxt_client": ccxt_client is not None,
+                "quickchart_client": quickchart_client is not None
+            }
+        },
+        headers={"Cache-Control": "no-store"}
+    )
 
 # Error handlers
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
-        content={"detail": exc.detail, "timestamp": datetime.utcnow().isoformat()}
+        content={"detail": exc.detail, "timestamp": datetime.utcnow()}
     )
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     logger.error(f"Unhandled exception: {str(exc)}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
-        content={"detail": "Internal server error", "timestamp": datetime.utcnow().isoformat()}
+        content={"detail": "Internal server error", "timestamp": datetime.utcnow()}
     )
 
-def run_web_app(host: str = "0.0.0.0", port: int = 5000, debug: bool = False):
+# Prefer uvloop/httptools (shipped with uvicorn[standard]) where the platform has them
+try:
+    import uvloop  # noqa: F401
+    UVICORN_LOOP = "uvloop"
+except ImportError:
+    UVICORN_LOOP = "asyncio"
+
+try:
+    import httptools  # noqa: F401
+    UVICORN_HTTP = "httptools"
+except ImportError:
+    UVICORN_HTTP = "h11"
+
+# The WebSocket manager and ticker broadcaster are per-process state, so more
+# than one worker splits clients between broadcasters
+WEB_WORKERS = int(os.getenv("WEB_WORKERS", "1"))
+
+def run_web_app(host: str = "0.0.0.0", port: int = 5000, debug: bool = False, workers: int = WEB_WORKERS):
     """Run the web application"""
     uvicorn.run(
         "src.interfaces.web.app:app",
         host=host,
         port=port,
         reload=debug,
-        log_level="info"
+        log_level="info",
+        loop=UVICORN_LOOP,
+        http=UVICORN_HTTP,
+        workers=1 if debug else workers
     )
 
 if __name__ == "__main__":
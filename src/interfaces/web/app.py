@@ -6,12 +6,19 @@ Replaces mock data with real ccxt-gateway integration
 """
 
 import asyncio
+import gzip
+import hashlib
 import json
 import os
+import secrets
 import sys
+import time
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import count
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, NamedTuple, Set
 import logging
 
 # Add src to path for imports
@@ -20,10 +27,14 @@ src_dir = current_dir.parent.parent
 sys.path.insert(0, str(src_dir))
 
 from fastapi import FastAPI, Request, Form, HTTPException, Depends, WebSocket, WebSocketDisconnect, BackgroundTasks
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, RedirectResponse, Response, StreamingResponse
+import aiohttp
+import orjson
 import uvicorn
 
+from data.managers.cache import CacheManager
+
 # Import our CCXT client
 try:
     from api_clients.ccxt_client import CCXTGatewayClient, get_market_prices, test_ccxt_connection
@@ -34,30 +45,149 @@ except ImportError as e:
         async def __aenter__(self): return self
         async def __aexit__(self, *args): pass
         async def get_ticker(self, symbol): return {"symbol": symbol, "price": 42380, "change_24h_pct": 1.5, "source": "fallback"}
-        async def get_multiple_tickers(self, symbols): return {s: await self.get_ticker(s) for s in symbols}
+        async def get_multiple_tickers(self, symbols):
+            # Fetch concurrently; a failing symbol is dropped instead of failing the batch
+            results = await asyncio.gather(*(self.get_ticker(s) for s in symbols), return_exceptions=True)
+            return {s: r for s, r in zip(symbols, results) if not isinstance(r, Exception)}
         async def health_check(self): return {"status": "fallback", "error": "CCXT client not available"}
 
+# MessagePack is optional; JSON is always available
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class WildcardCORSMiddleware:
+    """Allow-any-origin CORS without per-request origin matching.
+
+    Tags every HTTP response with ``Access-Control-Allow-Origin: *`` and
+    answers preflight requests directly.
+    """
+
+    ALLOW_ORIGIN = (b"access-control-allow-origin", b"*")
+    PREFLIGHT_HEADERS = [
+        ALLOW_ORIGIN,
+        (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+        (b"access-control-allow-headers", b"*"),
+        (b"access-control-max-age", b"600"),
+        (b"content-length", b"0"),
+    ]
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and any(
+            name == b"access-control-request-method" for name, _ in scope["headers"]
+        ):
+            await send({"type": "http.response.start", "status": 200, "headers": self.PREFLIGHT_HEADERS})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                # Copy rather than append: responses may share their header list
+                message["headers"] = [*message.get("headers", ()), self.ALLOW_ORIGIN]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+class StreamSafeGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that leaves server-sent event streams uncompressed.
+
+    The gzip stream buffers output, which would hold events back until
+    enough bytes pile up.
+    """
+
+    def __init__(self, app, uncompressed_paths=frozenset(), **kwargs):
+        super().__init__(app, **kwargs)
+        self.uncompressed_paths = uncompressed_paths
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in self.uncompressed_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
 app = FastAPI(
     title="Light Trading Bot",
     description="Advanced Trading Automation Platform with Real Data",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
+app.add_middleware(WildcardCORSMiddleware)
+
+# Compress JSON and other dynamic responses. Prerendered pages carry their own
+# Content-Encoding and pass through. Added after CORS so it wraps it: gzip
+# rewrites the header list it is handed, which CORS has already copied.
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    StreamSafeGZipMiddleware,
+    minimum_size=512,
+    compresslevel=6,
+    uncompressed_paths=frozenset({"/api/stream"})
 )
 
+class SessionStore:
+    """In-memory login sessions with a fixed TTL and a size cap.
+
+    Every session gets the same TTL, so insertion order is expiry order:
+    expired sessions are dropped from the front whenever one is created,
+    and the oldest are evicted once ``maxsize`` is reached.
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._sessions: "OrderedDict[str, tuple]" = OrderedDict()  # id -> (user_id, expires_at)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def create(self, session_id: str, user_id: str) -> None:
+        """Store a new session"""
+        self._purge_expired()
+        self._sessions[session_id] = (user_id, time.monotonic() + self.ttl_seconds)
+        while len(self._sessions) > self.maxsize:
+            self._sessions.popitem(last=False)
+
+    def get_user_id(self, session_id: str) -> Optional[str]:
+        """Return the session's user id, or None if unknown or expired"""
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+        user_id, expires_at = entry
+        if expires_at < time.monotonic():
+            self._sessions.pop(session_id, None)
+            return None
+        return user_id
+
+    def discard(self, session_id: Optional[str]) -> None:
+        """Forget a session (no-op if it does not exist)"""
+        if session_id:
+            self._sessions.pop(session_id, None)
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        while self._sessions:
+            _, (_, expires_at) = next(iter(self._sessions.items()))
+            if expires_at >= now:
+                break
+            self._sessions.popitem(last=False)
+
 # Session storage
-sessions = {}
+SESSION_TTL_SECONDS = 24 * 3600
+MAX_SESSIONS = 100_000
+sessions = SessionStore(SESSION_TTL_SECONDS, MAX_SESSIONS)
 demo_user = {
     "id": "demo_user_123",
     "username": "demo",
@@ -66,11 +196,92 @@ demo_user = {
 }
 
 # Default trading pairs
-DEFAULT_SYMBOLS = ["BTC/USDT", "ETH/USDT", "BNB/USDT", "ADA/USDT", "DOT/USDT"]
+DEFAULT_SYMBOLS = ("BTC/USDT", "ETH/USDT", "BNB/USDT", "ADA/USDT", "DOT/USDT")
 
-# Real-time market data cache
-market_data_cache = {}
+# Fields every order request must carry
+REQUIRED_ORDER_FIELDS = frozenset(("symbol", "side", "amount"))
+
+# Real-time market data cache. Treated as an immutable snapshot: updates replace the
+# whole dict (see store_market_data), so readers take one reference and use .get()
+market_data_cache: Dict[str, Dict[str, Any]] = {}
 last_market_update = None
+last_market_update_iso: Optional[str] = None  # formatted once per update for the hot paths
+
+def encode_market_snapshot() -> bytes:
+    """Serialize the /api/market-data/all payload for the current cache"""
+    return orjson.dumps({
+        "symbols": market_data_cache,
+        "last_updated": last_market_update_iso,
+        "total_symbols": len(market_data_cache),
+        "source": "ccxt_gateway"
+    })
+
+def encode_market_snapshot_msgpack() -> Optional[bytes]:
+    """MessagePack variant of the snapshot, or None without msgpack installed"""
+    if msgpack is None:
+        return None
+    return msgpack.packb({
+        "symbols": market_data_cache,
+        "last_updated": last_market_update_iso,
+        "total_symbols": len(market_data_cache),
+        "source": "ccxt_gateway"
+    })
+
+def encode_market_ws_payload() -> str:
+    """Serialize the websocket market_update frame for the current cache"""
+    return orjson.dumps({
+        "type": "market_update",
+        "data": market_data_cache,
+        "timestamp": last_market_update_iso
+    }).decode()
+
+# The cache only changes on refresh, so its API payload is encoded then, not per request
+market_data_snapshot = encode_market_snapshot()
+market_data_snapshot_msgpack = encode_market_snapshot_msgpack()
+market_ws_payload = encode_market_ws_payload()
+
+def encode_market_sse_event() -> bytes:
+    """Wrap the market_update frame as a server-sent event"""
+    return f"event: market_update\ndata: {market_ws_payload}\n\n".encode("utf-8")
+
+market_sse_event = encode_market_sse_event()
+
+# Connected /ws/market-data clients; updates are fanned out to them by broadcast_market_data
+market_ws_clients: Set[WebSocket] = set()
+# One wake-up queue per /api/stream client. maxsize=1: a client that falls
+# behind gets only the latest snapshot, never a backlog
+market_sse_queues: Set[asyncio.Queue] = set()
+
+def store_market_data(tickers: Dict[str, Any]) -> None:
+    """Replace the market data cache and re-encode its snapshots"""
+    global market_data_cache, last_market_update, last_market_update_iso
+    global market_data_snapshot, market_data_snapshot_msgpack, market_ws_payload, market_sse_event
+    market_data_cache = tickers
+    last_market_update = datetime.now()
+    last_market_update_iso = last_market_update.isoformat()
+    market_data_snapshot = encode_market_snapshot()
+    market_data_snapshot_msgpack = encode_market_snapshot_msgpack()
+    market_ws_payload = encode_market_ws_payload()
+    market_sse_event = encode_market_sse_event()
+
+async def broadcast_market_data() -> None:
+    """Push the current market_update frame to every stream and websocket client.
+
+    Websocket clients whose send fails are dropped so one dead connection
+    cannot hold up the rest.
+    """
+    for queue in market_sse_queues:
+        if not queue.full():
+            queue.put_nowait(None)
+    
+    if not market_ws_clients:
+        return
+    clients = tuple(market_ws_clients)
+    payload = market_ws_payload
+    results = await asyncio.gather(*(ws.send_text(payload) for ws in clients), return_exceptions=True)
+    for ws, result in zip(clients, results):
+        if isinstance(result, Exception):
+            market_ws_clients.discard(ws)
 
 # Mock portfolio data (will be replaced with real exchange data later)
 mock_portfolio = {
@@ -85,62 +296,227 @@ mock_portfolio = {
 }
 
 # Mock orders (will be replaced with real exchange orders)
-mock_orders = [
-    {"id": "1", "symbol": "BTC/USDT", "side": "BUY", "amount": "0.001", "price": "42000", "status": "PENDING", "timestamp": datetime.now().isoformat()},
-    {"id": "2", "symbol": "ETH/USDT", "side": "SELL", "amount": "0.5", "price": "2600", "status": "FILLED", "timestamp": (datetime.now() - timedelta(hours=1)).isoformat()}
-]
+_mock_orders_created = datetime.now()
+MAX_MOCK_ORDERS = 1000
+mock_orders = deque([
+    {"id": "1", "seq": 1, "symbol": "BTC/USDT", "side": "BUY", "amount": "0.001", "price": "42000", "status": "PENDING", "timestamp": _mock_orders_created.isoformat()},
+    {"id": "2", "seq": 2, "symbol": "ETH/USDT", "side": "SELL", "amount": "0.5", "price": "2600", "status": "FILLED", "timestamp": (_mock_orders_created - timedelta(hours=1)).isoformat()}
+], maxlen=MAX_MOCK_ORDERS)
+# Ids come from a counter, so concurrent orders never share one and evicted ids are not reused.
+# "seq" is a separate change cursor for /api/orders?since=: every new or changed order
+# takes the next seq and sits at the end of mock_orders, so changes go through update_mock_order
+_order_ids = count(len(mock_orders) + 1)
+_order_seqs = count(len(mock_orders) + 1)
+
+def update_mock_order(order_id: str, **changes: Any) -> Optional[Dict[str, Any]]:
+    """Apply changes (e.g. status) to an order so the next ?since= poll returns it"""
+    for order in mock_orders:
+        if order["id"] == order_id:
+            mock_orders.remove(order)
+            order.update(changes, seq=next(_order_seqs))
+            mock_orders.append(order)
+            return order
+    return None
+
+# Gateway settings are read once at import, never per request
+CCXT_GATEWAY_URL = os.getenv('CCXT_GATEWAY_URL', 'http://ccxt-bridge:3000')
+
+# Shared ccxt-gateway client: one HTTP session for the app's lifetime
+ccxt_client: Optional[CCXTGatewayClient] = None
+
+async def get_ccxt_client() -> CCXTGatewayClient:
+    """Return the shared gateway client, opening it on first use"""
+    global ccxt_client
+    if ccxt_client is None:
+        client = CCXTGatewayClient()
+        await client.__aenter__()
+        ccxt_client = client
+    return ccxt_client
+
+# Tickers are shared through Redis so that only one worker per interval polls the gateway
+MARKET_DATA_INTERVAL = 30
+MARKET_DATA_TIMEOUT = 10
+MARKET_DATA_KEY = "market_data:tickers"
+shared_cache = CacheManager()
+
+async def fetch_gateway_tickers() -> Dict[str, Any]:
+    """Fetch ticker data for the default symbols from ccxt-gateway.
+
+    Bounded by MARKET_DATA_TIMEOUT so a stalled gateway cannot hold up the
+    update loop or a manual refresh.
+    """
+    client = await get_ccxt_client()
+    return await asyncio.wait_for(client.get_multiple_tickers(DEFAULT_SYMBOLS), timeout=MARKET_DATA_TIMEOUT)
+
+# Gateway health is the same answer for every caller, so probe at most once per TTL
+GATEWAY_HEALTH_TTL = 5
+_gateway_health: Optional[Dict[str, Any]] = None
+_gateway_health_expires = 0.0
+_gateway_health_lock = asyncio.Lock()
+
+async def get_gateway_health(force: bool = False) -> Dict[str, Any]:
+    """Return ccxt-gateway's health_check result, cached for GATEWAY_HEALTH_TTL seconds.
+
+    Concurrent callers share a single probe; force skips the cached value.
+    Failures are not cached.
+    """
+    global _gateway_health, _gateway_health_expires
+    if not force and _gateway_health is not None and time.monotonic() < _gateway_health_expires:
+        return _gateway_health
+    
+    async with _gateway_health_lock:
+        # Another caller may have refreshed it while we waited for the lock
+        if not force and _gateway_health is not None and time.monotonic() < _gateway_health_expires:
+            return _gateway_health
+        client = await get_ccxt_client()
+        _gateway_health = await client.health_check()
+        _gateway_health_expires = time.monotonic() + GATEWAY_HEALTH_TTL
+        return _gateway_health
+
+# Optional push feed; when unset (or while it is down) tickers are polled over REST
+MARKET_STREAM_URL = os.getenv("CCXT_GATEWAY_WS_URL")
+
+async def stream_market_data(url: str) -> None:
+    """Apply ticker pushes from a gateway websocket until the connection drops.
+
+    Subscribes with ``{"action": "subscribe", "symbols": [...]}`` and expects
+    one JSON ticker object (with a ``symbol`` key) per text message.
+    """
+    async with aiohttp.ClientSession() as session:
+        async with session.ws_connect(url, heartbeat=30) as ws:
+            await ws.send_json({"action": "subscribe", "symbols": list(DEFAULT_SYMBOLS)})
+            logger.info("Streaming market data from %s", url)
+            
+            async for msg in ws:
+                if msg.type == aiohttp.WSMsgType.ERROR:
+                    break
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    continue
+                
+                ticker = orjson.loads(msg.data)
+                symbol = ticker.get("symbol")
+                if symbol in DEFAULT_SYMBOLS:
+                    store_market_data({**market_data_cache, symbol: ticker})
+                    await broadcast_market_data()
 
 # Background tasks for real-time data
 async def update_market_data():
-    """Background task to update market data every 30 seconds"""
-    global market_data_cache, last_market_update
-    
+    """Background task to keep market data fresh (push feed if configured, else 30s polling)"""
     while True:
+        if MARKET_STREAM_URL:
+            try:
+                await stream_market_data(MARKET_STREAM_URL)
+            except Exception as e:
+                logger.warning("Market data stream failed: %s", e)
+            # Stream is down: poll once below, then reconnect after the interval
+        
         try:
             logger.info("Updating market data from ccxt-gateway...")
             
-            async with CCXTGatewayClient() as client:
-                # Get ticker data for default symbols
-                tickers = await client.get_multiple_tickers(DEFAULT_SYMBOLS)
-                
-                # Update cache
-                market_data_cache = tickers
-                last_market_update = datetime.now()
-                
-                logger.info(f"Market data updated: {len(tickers)} symbols")
-                
-                # Log current prices
-                for symbol, data in tickers.items():
-                    logger.info(f"{symbol}: ${data['price']:,.2f} ({data.get('change_24h_pct', 0):+.2f}%)")
+            # Get ticker data for default symbols (from Redis if another worker just polled)
+            tickers = await shared_cache.get_or_set(MARKET_DATA_KEY, MARKET_DATA_INTERVAL, fetch_gateway_tickers)
+            
+            # Update cache
+            store_market_data(tickers)
+            await broadcast_market_data()
+            
+            logger.info("Market data updated: %d symbols", len(tickers))
+            
+            # Log current prices as one line
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Prices: %s", ", ".join(
+                    f"{symbol} ${data['price']:,.2f} ({data.get('change_24h_pct', 0):+.2f}%)"
+                    for symbol, data in tickers.items()
+                ))
                 
         except Exception as e:
-            logger.error(f"Failed to update market data: {e}")
+            logger.error("Failed to update market data: %s", e)
             # Keep using cached data if available
         
         # Wait 30 seconds before next update
-        await asyncio.sleep(30)
-
-# Authentication helpers
-async def create_session(user_id: str) -> str:
-    session_id = f"session_{user_id}_{datetime.now().timestamp()}"
-    sessions[session_id] = {
-        "user_id": user_id,
-        "created_at": datetime.now(),
-        "expires_at": datetime.now() + timedelta(hours=24)
-    }
+        await asyncio.sleep(MARKET_DATA_INTERVAL)
+
+# Health/status timestamps only need 1s resolution; format once per second
+_iso_now_cache = {"second": 0, "iso": ""}
+
+def iso_now() -> str:
+    """Current local time as an ISO string, cached per second"""
+    second = int(time.time())
+    if second != _iso_now_cache["second"]:
+        _iso_now_cache["second"] = second
+        _iso_now_cache["iso"] = datetime.fromtimestamp(second).isoformat()
+    return _iso_now_cache["iso"]
+
+@lru_cache(maxsize=1024)
+def format_usd(value: Any) -> str:
+    """Display form of a price ("$42,380.00"); memoized since the same prices repeat"""
+    try:
+        return f"${float(value):,.2f}"
+    except (TypeError, ValueError):
+        return str(value)
+
+# Authentication helpers (in-memory lookups, so plain functions rather than coroutines)
+def create_session(user_id: str) -> str:
+    session_id = secrets.token_urlsafe(32)
+    sessions.create(session_id, user_id)
     return session_id
 
-async def get_current_user(request: Request):
+def get_current_user(request: Request):
     session_id = request.cookies.get("session_id")
     if not session_id:
         return None
     
-    session = sessions.get(session_id)
-    if not session or session["expires_at"] < datetime.now():
+    if sessions.get_user_id(session_id) is None:
         return None
     
     return demo_user
 
+async def require_user(request: Request) -> Dict[str, Any]:
+    """Dependency for API endpoints: the logged-in user, or 401"""
+    user = get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401)
+    return user
+
+# Static page responses; pages behind a session must always revalidate so
+# the login redirect still applies, the public login page can be reused briefly
+PAGE_CACHE_CONTROL = "private, no-cache"
+PUBLIC_PAGE_CACHE_CONTROL = "public, max-age=60, must-revalidate"
+
+class PageVariant(NamedTuple):
+    etag: bytes
+    response: Response
+    not_modified: Response
+
+class PrerenderedPage(NamedTuple):
+    identity: PageVariant
+    gzip: PageVariant
+
+def page_response(request: Request, page: PrerenderedPage) -> Response:
+    """Serve a prerendered page, answering 304 when the client already has it.
+
+    The returned responses are built once and shared between requests;
+    Starlette only reads their body and headers when sending.
+    """
+    # One pass over the raw ASGI headers instead of building a Headers mapping
+    accept_encoding = if_none_match = b""
+    for name, value in request.scope["headers"]:
+        if name == b"accept-encoding":
+            accept_encoding = value
+        elif name == b"if-none-match":
+            if_none_match = value
+
+    variant = page.gzip if b"gzip" in accept_encoding else page.identity
+    if if_none_match == variant.etag:
+        return variant.not_modified
+    return variant.response
+
+def protected_page_response(request: Request, page: PrerenderedPage) -> Response:
+    """Serve a prerendered page to logged-in users, redirect everyone else to login"""
+    if not get_current_user(request):
+        return RedirectResponse(url="/login")
+    return page_response(request, page)
+
 # Startup event to begin background tasks
 @app.on_event("startup")
 async def startup_event():
@@ -149,188 +525,169 @@ async def startup_event():
     
     # Test ccxt-gateway connection
     try:
-        async with CCXTGatewayClient() as client:
-            health = await client.health_check()
-            logger.info(f"CCXT Gateway health: {health}")
+        health = await get_gateway_health()
+        logger.info("CCXT Gateway health: %r", health)
     except Exception as e:
-        logger.warning(f"CCXT Gateway connection test failed: {e}")
+        logger.warning("CCXT Gateway connection test failed: %s", e)
     
     # Start market data updates
     asyncio.create_task(update_market_data())
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the shared gateway client and Redis connection"""
+    global ccxt_client
+    if ccxt_client is not None:
+        await ccxt_client.__aexit__(None, None, None)
+        ccxt_client = None
+    await shared_cache.close()
+
 # Routes
 @app.get("/", response_class=HTMLResponse)
 async def root(request: Request):
-    user = await get_current_user(request)
+    user = get_current_user(request)
     if user:
         return RedirectResponse(url="/dashboard")
     
-    return HTMLResponse(get_login_page())
+    return page_response(request, LOGIN_PAGE)
 
 @app.get("/login", response_class=HTMLResponse)
-async def login_page():
-    return HTMLResponse(get_login_page())
+async def login_page(request: Request):
+    return page_response(request, LOGIN_PAGE)
 
 @app.post("/login")
 async def login_submit(username: str = Form(...), password: str = Form(...)):
     if username == "demo" and password == "demo123":
-        session_id = await create_session(demo_user["id"])
+        session_id = create_session(demo_user["id"])
         response = RedirectResponse(url="/dashboard", status_code=302)
         response.set_cookie("session_id", session_id, httponly=True)
         return response
     else:
-        return HTMLResponse(get_login_page(error="Invalid credentials"))
+        return LOGIN_INVALID_CREDENTIALS_RESPONSE
 
 @app.get("/logout")
 async def logout(request: Request):
+    sessions.discard(request.cookies.get("session_id"))
     response = RedirectResponse(url="/login")
     response.delete_cookie("session_id")
     return response
 
-@app.get("/dashboard", response_class=HTMLResponse)
-async def dashboard(request: Request):
-    user = await get_current_user(request)
-    if not user:
-        return RedirectResponse(url="/login")
-    return HTMLResponse(get_dashboard_page())
-
-@app.get("/trading", response_class=HTMLResponse)
-async def trading(request: Request):
-    user = await get_current_user(request)
-    if not user:
-        return RedirectResponse(url="/login")
-    return HTMLResponse(get_trading_page())
-
-@app.get("/strategies", response_class=HTMLResponse)
-async def strategies(request: Request):
-    user = await get_current_user(request)
-    if not user:
-        return RedirectResponse(url="/login")
-    return HTMLResponse(get_strategies_page())
-
-@app.get("/settings", response_class=HTMLResponse)
-async def settings(request: Request):
-    user = await get_current_user(request)
-    if not user:
-        return RedirectResponse(url="/login")
-    return HTMLResponse(get_settings_page())
+# /dashboard, /trading, /strategies and /settings are registered once the pages are prerendered (see below)
 
 # API endpoints - NOW WITH REAL DATA
 @app.get("/api/portfolio")
-async def api_portfolio(request: Request):
-    user = await get_current_user(request)
-    if not user:
-        raise HTTPException(status_code=401)
-    
+async def api_portfolio(user: Dict[str, Any] = Depends(require_user)):
     # TODO: Replace with real exchange balance
-    # For now, return mock data but with real market values
-    portfolio = mock_portfolio.copy()
+    # For now, return mock data but with real market values.
+    # Positions are joined into new dicts so the shared mock data is never mutated.
+    cache = market_data_cache
+    positions = []
+    for position in mock_portfolio["positions"]:
+        ticker = cache.get(position["symbol"])
+        if ticker:
+            current_price = ticker["price"]
+            position = {**position, "current_price": current_price, "value": position["amount"] * current_price}
+        positions.append(position)
     
-    # Update position values with real market prices if available
-    if market_data_cache:
-        for position in portfolio["positions"]:
-            symbol = position["symbol"]
-            if symbol in market_data_cache:
-                current_price = market_data_cache[symbol]["price"]
-                position["current_price"] = current_price
-                position["value"] = position["amount"] * current_price
-    
-    portfolio["last_updated"] = datetime.now().isoformat()
-    portfolio["data_source"] = "real_prices" if market_data_cache else "mock"
-    
-    return portfolio
+    return ORJSONResponse({
+        **mock_portfolio,
+        "positions": positions,
+        "last_updated": iso_now(),
+        "data_source": "real_prices" if cache else "mock"
+    })
 
 @app.get("/api/market-data")
 async def api_market_data(symbol: str = "BTC/USDT"):
-    user_data = market_data_cache.get(symbol)
+    cached_ticker = market_data_cache.get(symbol)
     
-    if user_data:
-        return {
+    if cached_ticker:
+        return ORJSONResponse({
             "symbol": symbol,
-            "price": user_data["price"],
-            "change_24h": user_data.get("change_24h", 0),
-            "change_24h_pct": user_data.get("change_24h_pct", 0),
-            "volume_24h": user_data.get("volume_24h", 0),
-            "high_24h": user_data.get("high_24h", 0),
-            "low_24h": user_data.get("low_24h", 0),
-            "timestamp": user_data.get("timestamp"),
-            "source": user_data.get("source", "ccxt_gateway"),
-            "last_updated": last_market_update.isoformat() if last_market_update else None
-        }
+            "price": cached_ticker["price"],
+            "change_24h": cached_ticker.get("change_24h", 0),
+            "change_24h_pct": cached_ticker.get("change_24h_pct", 0),
+            "volume_24h": cached_ticker.get("volume_24h", 0),
+            "high_24h": cached_ticker.get("high_24h", 0),
+            "low_24h": cached_ticker.get("low_24h", 0),
+            "timestamp": cached_ticker.get("timestamp"),
+            "source": cached_ticker.get("source", "ccxt_gateway"),
+            "last_updated": last_market_update_iso
+        })
     else:
         # Return real-time data if cache is empty
         try:
-            async with CCXTGatewayClient() as client:
-                ticker = await client.get_ticker(symbol)
-                return ticker
+            client = await get_ccxt_client()
+            ticker = await client.get_ticker(symbol)
+            return ORJSONResponse(ticker)
         except Exception as e:
-            logger.error(f"Failed to get real-time data for {symbol}: {e}")
+            logger.error("Failed to get real-time data for %s: %s", symbol, e)
             raise HTTPException(status_code=503, detail="Market data unavailable")
 
 @app.get("/api/market-data/all")
-async def api_all_market_data(request: Request):
-    user = await get_current_user(request)
-    if not user:
-        raise HTTPException(status_code=401)
-    
-    return {
-        "symbols": market_data_cache,
-        "last_updated": last_market_update.isoformat() if last_market_update else None,
-        "total_symbols": len(market_data_cache),
-        "source": "ccxt_gateway"
-    }
+async def api_all_market_data(request: Request, user: Dict[str, Any] = Depends(require_user)):
+    if market_data_snapshot_msgpack is not None and "msgpack" in request.headers.get("accept", ""):
+        return Response(market_data_snapshot_msgpack, media_type="application/msgpack")
+    return Response(market_data_snapshot, media_type="application/json")
 
 @app.get("/api/orders")
-async def api_orders(request: Request):
-    user = await get_current_user(request)
-    if not user:
-        raise HTTPException(status_code=401)
-    
+async def api_orders(since: int = 0, user: Dict[str, Any] = Depends(require_user)):
+    """List orders; with ?since=<seq> only those created or changed after that cursor"""
     # TODO: Replace with real exchange orders
-    orders = mock_orders.copy()
+    # mock_orders is in seq order, so walk back from the newest and stop at the cursor
+    new_orders = []
+    for order in reversed(mock_orders):
+        if order["seq"] <= since:
+            break
+        new_orders.append(order)
+    new_orders.reverse()
     
-    # Add current prices to orders
-    for order in orders:
-        symbol = order["symbol"]
-        if symbol in market_data_cache:
-            order["current_price"] = market_data_cache[symbol]["price"]
+    # Add current prices and display strings to copies of the orders, leaving mock_orders untouched
+    cache = market_data_cache
+    orders = []
+    for order in new_orders:
+        ticker = cache.get(order["symbol"])
+        current_price = ticker["price"] if ticker else order.get("current_price")
+        orders.append({
+            **order,
+            "price_str": format_usd(order["price"]),
+            "current_price": current_price,
+            "current_price_str": format_usd(current_price) if current_price else None
+        })
     
-    return {
+    return ORJSONResponse({
         "orders": orders,
-        "total": len(orders),
+        "last_seq": mock_orders[-1]["seq"] if mock_orders else since,
+        "total": len(mock_orders),
         "data_source": "mock"  # Will be "exchange" when real integration is complete
-    }
+    })
 
 @app.post("/api/orders")
-async def api_create_order(request: Request, order_data: dict):
-    user = await get_current_user(request)
-    if not user:
-        raise HTTPException(status_code=401)
-    
+async def api_create_order(order_data: dict, user: Dict[str, Any] = Depends(require_user)):
     # Validate order data
-    required_fields = ["symbol", "side", "amount"]
-    for field in required_fields:
-        if field not in order_data:
-            raise HTTPException(status_code=400, detail=f"Missing required field: {field}")
+    missing = REQUIRED_ORDER_FIELDS - order_data.keys()
+    if missing:
+        raise HTTPException(status_code=400, detail=f"Missing required field: {', '.join(sorted(missing))}")
     
     # Get current market price for validation
     symbol = order_data["symbol"]
     current_price = None
     
-    if symbol in market_data_cache:
-        current_price = market_data_cache[symbol]["price"]
+    cached_ticker = market_data_cache.get(symbol)
+    if cached_ticker:
+        current_price = cached_ticker["price"]
     else:
         try:
-            async with CCXTGatewayClient() as client:
-                ticker = await client.get_ticker(symbol)
-                current_price = ticker["price"]
+            client = await get_ccxt_client()
+            ticker = await client.get_ticker(symbol)
+            current_price = ticker["price"]
         except Exception as e:
-            logger.error(f"Failed to get current price for {symbol}: {e}")
+            logger.error("Failed to get current price for %s: %s", symbol, e)
     
     # TODO: Replace with real ccxt-gateway order placement
     # For now, simulate the order
     new_order = {
-        "id": str(len(mock_orders) + 1),
+        "id": str(next(_order_ids)),
+        "seq": next(_order_seqs),
         "symbol": order_data["symbol"],
         "side": order_data["side"].upper(),
         "amount": str(order_data["amount"]),
@@ -344,73 +701,96 @@ async def api_create_order(request: Request, order_data: dict):
     
     mock_orders.append(new_order)
     
-    logger.info(f"Order simulated: {new_order}")
+    logger.info("Order simulated: %r", new_order)
     
-    return {
+    return ORJSONResponse({
         "success": True,
         "order": new_order,
         "message": f"Order simulated successfully (real trading coming soon)"
-    }
+    })
 
 @app.get("/api/ccxt-status")
-async def api_ccxt_status():
-    """Check ccxt-gateway status"""
+async def api_ccxt_status(force: bool = False):
+    """Check ccxt-gateway status (cached briefly; ?force=1 probes the gateway now)"""
     try:
-        async with CCXTGatewayClient() as client:
-            health = await client.health_check()
-            return health
+        health = await get_gateway_health(force=force)
+        return ORJSONResponse(health)
     except Exception as e:
-        return {
+        return ORJSONResponse({
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
-        }
+            "timestamp": iso_now()
+        })
 
 @app.post("/api/refresh-market-data")
-async def api_refresh_market_data(request: Request):
+async def api_refresh_market_data(user: Dict[str, Any] = Depends(require_user)):
     """Manually refresh market data"""
-    user = await get_current_user(request)
-    if not user:
-        raise HTTPException(status_code=401)
-    
     try:
-        async with CCXTGatewayClient() as client:
-            tickers = await client.get_multiple_tickers(DEFAULT_SYMBOLS)
-            
-            global market_data_cache, last_market_update
-            market_data_cache = tickers
-            last_market_update = datetime.now()
-            
-            return {
-                "success": True,
-                "symbols_updated": len(tickers),
-                "timestamp": last_market_update.isoformat(),
-                "data": tickers
-            }
+        # Manual refresh always goes upstream, then replaces the shared copy
+        await shared_cache.invalidate(MARKET_DATA_KEY)
+        tickers = await shared_cache.get_or_set(MARKET_DATA_KEY, MARKET_DATA_INTERVAL, fetch_gateway_tickers)
+        
+        store_market_data(tickers)
+        await broadcast_market_data()
+        
+        return ORJSONResponse({
+            "success": True,
+            "symbols_updated": len(tickers),
+            "timestamp": last_market_update_iso,
+            "data": tickers
+        })
     except Exception as e:
-        logger.error(f"Failed to refresh market data: {e}")
+        logger.error("Failed to refresh market data: %s", e)
         raise HTTPException(status_code=503, detail=f"Failed to refresh market data: {e}")
 
 @app.get("/health")
 async def health():
     ccxt_status = "unknown"
     try:
-        async with CCXTGatewayClient() as client:
-            health_check = await client.health_check()
-            ccxt_status = health_check.get("status", "unknown")
+        health_check = await get_gateway_health()
+        ccxt_status = health_check.get("status", "unknown")
     except Exception:
         ccxt_status = "unavailable"
     
-    return {
+    return ORJSONResponse({
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": iso_now(),
         "mode": "real_data_integration",
         "ccxt_gateway": ccxt_status,
         "market_data_cache": len(market_data_cache),
-        "last_market_update": last_market_update.isoformat() if last_market_update else None,
+        "last_market_update": last_market_update_iso,
         "version": "1.0.0",
         "features": ["real_market_data", "login", "dashboard", "trading", "api"]
-    }
+    })
+
+# Server-sent events for the pages; the browser's EventSource reconnects by itself
+SSE_KEEPALIVE_SECONDS = 15
+
+@app.get("/api/stream")
+async def api_stream(user: Dict[str, Any] = Depends(require_user)):
+    """Stream market_update events as the cache changes"""
+    async def events():
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        market_sse_queues.add(queue)
+        try:
+            if market_data_cache:
+                yield market_sse_event
+            while True:
+                try:
+                    await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    # Comment line so proxies don't close an idle stream
+                    yield b": keepalive\n\n"
+                    continue
+                yield market_sse_event
+        finally:
+            market_sse_queues.discard(queue)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 # WebSocket for real-time updates
 @app.websocket("/ws/market-data")
@@ -418,57 +798,31 @@ async def websocket_market_data(websocket: WebSocket):
     await websocket.accept()
     
     try:
+        # Current prices right away; later frames are pushed by broadcast_market_data.
+        # Frames stay text because the page does JSON.parse on event.data
+        if market_data_cache:
+            await websocket.send_text(market_ws_payload)
+        market_ws_clients.add(websocket)
+        
+        # Nothing is expected from the client; this only notices the disconnect
         while True:
-            if market_data_cache:
-                await websocket.send_json({
-                    "type": "market_update",
-                    "data": market_data_cache,
-                    "timestamp": last_market_update.isoformat() if last_market_update else None
-                })
-            
-            await asyncio.sleep(5)  # Send updates every 5 seconds
+            await websocket.receive_text()
             
     except WebSocketDisconnect:
         logger.info("WebSocket client disconnected")
+    finally:
+        market_ws_clients.discard(websocket)
 
 # HTML Templates (updated with real-time features)
 def get_base_template():
-    return """
+    # Shared CSS/JS live in static/ under content-hashed URLs (see register_static_asset)
+    return f"""
 <!DOCTYPE html>
 <html>
 <head>
-    <title>{title}</title>
+    <title>{{title}}</title>
     <meta name="viewport" content="width=device-width, initial-scale=1">
-    <style>
-        body {{ font-family: Arial; background: linear-gradient(135deg, #1a1a2e, #16213e); color: white; margin: 0; padding: 0; }}
-        .navbar {{ background: rgba(0,0,0,0.3); padding: 1rem; display: flex; justify-content: space-between; align-items: center; }}
-        .navbar a {{ color: #4CAF50; text-decoration: none; margin-right: 20px; padding: 8px 16px; border-radius: 4px; transition: background 0.2s; }}
-        .navbar a:hover {{ background: rgba(76,175,80,0.2); }}
-        .container {{ padding: 20px; max-width: 1200px; margin: 0 auto; }}
-        .card {{ background: rgba(255,255,255,0.1); padding: 20px; margin: 20px 0; border-radius: 10px; backdrop-filter: blur(10px); border: 1px solid rgba(255,255,255,0.2); }}
-        .btn {{ padding: 10px 20px; background: #4CAF50; color: white; border: none; border-radius: 5px; cursor: pointer; text-decoration: none; display: inline-block; margin: 5px; }}
-        .btn:hover {{ background: #45a049; }}
-        .btn-danger {{ background: #f44336; }}
-        .btn-secondary {{ background: #2196F3; }}
-        input, select {{ width: 100%; padding: 10px; margin: 10px 0; border: 1px solid #ccc; border-radius: 5px; background: rgba(255,255,255,0.1); color: white; box-sizing: border-box; }}
-        table {{ width: 100%; border-collapse: collapse; }}
-        th, td {{ padding: 10px; border-bottom: 1px solid rgba(255,255,255,0.1); }}
-        th {{ background: rgba(255,255,255,0.1); }}
-        .metric {{ text-align: center; padding: 20px; background: rgba(255,255,255,0.05); border-radius: 10px; margin: 10px; }}
-        .metric-value {{ font-size: 2rem; font-weight: bold; color: #4CAF50; }}
-        .grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; }}
-        .live-indicator {{ display: inline-block; width: 8px; height: 8px; background: #4CAF50; border-radius: 50%; animation: pulse 2s infinite; margin-right: 8px; }}
-        @keyframes pulse {{ 0% {{ opacity: 1; }} 50% {{ opacity: 0.5; }} 100% {{ opacity: 1; }} }}
-        .notification {{ position: fixed; top: 20px; right: 20px; padding: 1rem 2rem; background: #4CAF50; color: white; border-radius: 8px; display: none; z-index: 1000; }}
-        .notification.error {{ background: #f44336; }}
-        .status-indicator {{ padding: 2px 8px; border-radius: 12px; font-size: 0.8rem; }}
-        .status-real {{ background: #4CAF50; }}
-        .status-mock {{ background: #FF9800; }}
-        .status-error {{ background: #f44336; }}
-        .price-up {{ color: #4CAF50; }}
-        .price-down {{ color: #f44336; }}
-        .real-time-badge {{ background: linear-gradient(45deg, #4CAF50, #45a049); padding: 4px 8px; border-radius: 4px; font-size: 0.8rem; margin-left: 10px; }}
-    </style>
+    <link rel="stylesheet" href="{APP_CSS_URL}">
 </head>
 <body>
     <nav class="navbar">
@@ -483,109 +837,10 @@ def get_base_template():
             <a href="/logout">🚪 Logout</a>
         </div>
     </nav>
-    <div class="container">{content}</div>
+    <div class="container">{{content}}</div>
     <div id="notification" class="notification"></div>
     
-    <script>
-        let marketDataSocket = null;
-        let lastMarketData = {{}};
-        
-        function connectWebSocket() {{
-            try {{
-                marketDataSocket = new WebSocket(`ws://${{window.location.host}}/ws/market-data`);
-                
-                marketDataSocket.onmessage = function(event) {{
-                    const data = JSON.parse(event.data);
-                    if (data.type === 'market_update') {{
-                        updateMarketData(data.data);
-                        lastMarketData = data.data;
-                    }}
-                }};
-                
-                marketDataSocket.onclose = function() {{
-                    console.log('WebSocket disconnected, reconnecting in 5 seconds...');
-                    setTimeout(connectWebSocket, 5000);
-                }};
-            }} catch (error) {{
-                console.log('WebSocket connection failed:', error);
-            }}
-        }}
-        
-        function updateMarketData(marketData) {{
-            // Update price displays throughout the page
-            for (const [symbol, data] of Object.entries(marketData)) {{
-                const priceElements = document.querySelectorAll(`[data-symbol="${{symbol}}"]`);
-                priceElements.forEach(element => {{
-                    const oldPrice = parseFloat(element.textContent.replace(/[$,]/g, ''));
-                    const newPrice = data.price;
-                    
-                    // Update price
-                    element.textContent = `$${{{newPrice.toLocaleString()}}}`;
-                    
-                    // Add color indication for price change
-                    if (oldPrice && oldPrice !== newPrice) {{
-                        element.className = newPrice > oldPrice ? 'price-up' : 'price-down';
-                        setTimeout(() => element.className = '', 2000);
-                    }}
-                }});
-                
-                // Update change percentage
-                const changeElements = document.querySelectorAll(`[data-change="${{symbol}}"]`);
-                changeElements.forEach(element => {{
-                    const change = data.change_24h_pct || 0;
-                    element.textContent = `${{change >= 0 ? '+' : ''}}${{change.toFixed(2)}}%`;
-                    element.className = change >= 0 ? 'price-up' : 'price-down';
-                }});
-            }}
-            
-            // Update last updated timestamp
-            const timestampElements = document.querySelectorAll('.last-updated');
-            timestampElements.forEach(element => {{
-                element.textContent = `Last updated: ${{new Date().toLocaleTimeString()}}`;
-            }});
-        }}
-        
-        function showNotification(message, type = 'success') {{
-            const notification = document.getElementById('notification');
-            notification.textContent = message;
-            notification.className = 'notification ' + type;
-            notification.style.display = 'block';
-            setTimeout(() => {{ notification.style.display = 'none'; }}, 5000);
-        }}
-        
-        async function fetchAPI(url, options = {{}}) {{
-            try {{
-                const response = await fetch(url, {{
-                    headers: {{ 'Content-Type': 'application/json', ...options.headers }},
-                    ...options
-                }});
-                if (!response.ok) throw new Error(`HTTP error! status: ${{response.status}}`);
-                return await response.json();
-            }} catch (error) {{
-                console.error('API Error:', error);
-                showNotification('API Error: ' + error.message, 'error');
-                throw error;
-            }}
-        }}
-        
-        async function refreshMarketData() {{
-            try {{
-                showNotification('Refreshing market data...', 'info');
-                const result = await fetchAPI('/api/refresh-market-data', {{ method: 'POST' }});
-                showNotification(`Market data refreshed: ${{result.symbols_updated}} symbols updated`);
-                
-                // Update display immediately
-                updateMarketData(result.data);
-            }} catch (error) {{
-                showNotification('Failed to refresh market data', 'error');
-            }}
-        }}
-        
-        // Connect to WebSocket when page loads
-        document.addEventListener('DOMContentLoaded', function() {{
-            connectWebSocket();
-        }});
-    </script>
+    <script defer src="{APP_JS_URL}"></script>
 </body>
 </html>
     """
@@ -689,6 +944,27 @@ def get_login_page(error=None):
     </html>
     """
 
+# Symbol-driven page fragments, generated once from the symbol tuples
+TRADING_TABLE_SYMBOLS = DEFAULT_SYMBOLS[:3]
+DASHBOARD_METRIC_SYMBOLS = DEFAULT_SYMBOLS[:4]
+
+MARKET_TABLE_ROWS = "".join(f"""
+                    <tr>
+                        <td>{symbol}</td>
+                        <td data-symbol="{symbol}">Loading...</td>
+                        <td data-change="{symbol}">--</td>
+                        <td><span class="status-indicator status-real">LIVE</span></td>
+                    </tr>""" for symbol in TRADING_TABLE_SYMBOLS)
+
+DASHBOARD_MARKET_METRICS = "".join(f"""
+                <div class="metric">
+                    <div class="metric-value" data-symbol="{symbol}">Loading...</div>
+                    <div>{symbol} <span data-change="{symbol}">--</span></div>
+                </div>""" for symbol in DASHBOARD_METRIC_SYMBOLS)
+
+SYMBOL_OPTIONS = "".join(f"""
+                            <option value="{symbol}">{symbol}</option>""" for symbol in DEFAULT_SYMBOLS)
+
 def get_dashboard_page():
     """Generate dashboard page HTML with real-time market data"""
     return get_base_template().format(
@@ -716,25 +992,9 @@ def get_dashboard_page():
             </div>
         </div>
         
-        <div class="card">
+        <div class="card live-market-card">
             <h3>📈 Live Market Data <span class="status-indicator status-real">REAL-TIME</span></h3>
-            <div class="grid">
-                <div class="metric">
-                    <div class="metric-value" data-symbol="BTC/USDT">Loading...</div>
-                    <div>BTC/USDT <span data-change="BTC/USDT">--</span></div>
-                </div>
-                <div class="metric">
-                    <div class="metric-value" data-symbol="ETH/USDT">Loading...</div>
-                    <div>ETH/USDT <span data-change="ETH/USDT">--</span></div>
-                </div>
-                <div class="metric">
-                    <div class="metric-value" data-symbol="BNB/USDT">Loading...</div>
-                    <div>BNB/USDT <span data-change="BNB/USDT">--</span></div>
-                </div>
-                <div class="metric">
-                    <div class="metric-value" data-symbol="ADA/USDT">Loading...</div>
-                    <div>ADA/USDT <span data-change="ADA/USDT">--</span></div>
-                </div>
+            <div class="grid">""" + DASHBOARD_MARKET_METRICS + """
             </div>
             <button class="btn btn-secondary" onclick="refreshMarketData()">🔄 Refresh Market Data</button>
             <div class="last-updated" style="margin-top: 10px; font-size: 0.9rem; opacity: 0.8;">
@@ -748,27 +1008,26 @@ def get_dashboard_page():
                 <tr><td>Web Interface</td><td style="color: #4CAF50;">✅ Running</td></tr>
                 <tr><td>CCXT Gateway</td><td id="ccxt-status" style="color: #FF9800;">⏳ Checking...</td></tr>
                 <tr><td>Market Data</td><td style="color: #4CAF50;">✅ Live Feed</td></tr>
-                <tr><td>Real-time Updates</td><td style="color: #4CAF50;">✅ WebSocket Active</td></tr>
+                <tr><td>Real-time Updates</td><td style="color: #4CAF50;">✅ Live Stream Active</td></tr>
             </table>
         </div>
         
         <script>
             // Check CCXT status on page load
             async function checkCCXTStatus() {
+                const statusElement = document.getElementById('ccxt-status');
                 try {
-                    const status = await fetchAPI('/api/ccxt-status');
-                    const statusElement = document.getElementById('ccxt-status');
+                    const status = await getCcxtStatus();
                     
                     if (status.status === 'healthy') {
-                        statusElement.innerHTML = '✅ Connected';
+                        statusElement.textContent = '✅ Connected';
                         statusElement.style.color = '#4CAF50';
                     } else {
-                        statusElement.innerHTML = '⚠️ Issues Detected';
+                        statusElement.textContent = '⚠️ Issues Detected';
                         statusElement.style.color = '#FF9800';
                     }
                 } catch (error) {
-                    const statusElement = document.getElementById('ccxt-status');
-                    statusElement.innerHTML = '❌ Connection Failed';
+                    statusElement.textContent = '❌ Connection Failed';
                     statusElement.style.color = '#f44336';
                 }
             }
@@ -789,28 +1048,10 @@ def get_trading_page():
         <h1>💰 Trading Interface <span class="real-time-badge">🔴 LIVE DATA</span></h1>
         
         <div class="grid">
-            <div class="card">
+            <div class="card live-market-card">
                 <h3>📊 Live Market Data</h3>
                 <table>
-                    <tr><th>Symbol</th><th>Price</th><th>24h Change</th><th>Status</th></tr>
-                    <tr>
-                        <td>BTC/USDT</td>
-                        <td data-symbol="BTC/USDT">Loading...</td>
-                        <td data-change="BTC/USDT">--</td>
-                        <td><span class="status-indicator status-real">LIVE</span></td>
-                    </tr>
-                    <tr>
-                        <td>ETH/USDT</td>
-                        <td data-symbol="ETH/USDT">Loading...</td>
-                        <td data-change="ETH/USDT">--</td>
-                        <td><span class="status-indicator status-real">LIVE</span></td>
-                    </tr>
-                    <tr>
-                        <td>BNB/USDT</td>
-                        <td data-symbol="BNB/USDT">Loading...</td>
-                        <td data-change="BNB/USDT">--</td>
-                        <td><span class="status-indicator status-real">LIVE</span></td>
-                    </tr>
+                    <tr><th>Symbol</th><th>Price</th><th>24h Change</th><th>Status</th></tr>""" + MARKET_TABLE_ROWS + """
                 </table>
                 <button class="btn btn-secondary" onclick="refreshMarketData()">🔄 Refresh Prices</button>
                 <div class="last-updated" style="margin-top: 10px; font-size: 0.9rem; opacity: 0.8;">
@@ -823,12 +1064,7 @@ def get_trading_page():
                 <form onsubmit="return submitTrade(event)">
                     <div style="margin: 15px 0;">
                         <label>Symbol:</label>
-                        <select name="symbol" required>
-                            <option value="BTC/USDT">BTC/USDT</option>
-                            <option value="ETH/USDT">ETH/USDT</option>
-                            <option value="BNB/USDT">BNB/USDT</option>
-                            <option value="ADA/USDT">ADA/USDT</option>
-                            <option value="DOT/USDT">DOT/USDT</option>
+                        <select name="symbol" required>""" + SYMBOL_OPTIONS + """
                         </select>
                     </div>
                     <div style="margin: 15px 0;">
@@ -858,21 +1094,55 @@ def get_trading_page():
             </div>
         </div>
         
-        <div class="card">
+        <div class="card live-market-card">
             <h3>📋 Recent Orders</h3>
             <table id="orders-table">
-                <tr><th>Symbol</th><th>Side</th><th>Amount</th><th>Price</th><th>Status</th><th>Current Price</th></tr>
-                <tr><td colspan="6">Loading orders...</td></tr>
+                <thead>
+                    <tr><th>Symbol</th><th>Side</th><th>Amount</th><th>Price</th><th>Status</th><th>Current Price</th></tr>
+                </thead>
+                <tbody>
+                    <tr><td colspan="6">Loading orders...</td></tr>
+                </tbody>
             </table>
+            <template id="order-row-tmpl">
+                <tr><td class="sym"></td><td class="side"></td><td class="amt"></td><td class="price"></td><td><span class="status-indicator"></span></td><td class="cur"></td></tr>
+            </template>
+        </div>
+        
+        <div id="confirm-modal" class="modal hidden" role="dialog" aria-modal="true">
+            <div class="modal-box">
+                <p id="confirm-message"></p>
+                <button type="button" class="btn" id="confirm-yes">Confirm</button>
+                <button type="button" class="btn btn-danger" id="confirm-no">Cancel</button>
+            </div>
         </div>
         
         <script>
+            // In-page replacement for window.confirm: nothing blocks the main thread
+            // while the live price updates keep painting
+            function confirmAction(message) {
+                const modal = document.getElementById('confirm-modal');
+                const yesButton = document.getElementById('confirm-yes');
+                const noButton = document.getElementById('confirm-no');
+                document.getElementById('confirm-message').textContent = message;
+                
+                return new Promise(resolve => {
+                    const close = answer => {
+                        modal.classList.add('hidden');
+                        resolve(answer);
+                    };
+                    yesButton.onclick = () => close(true);
+                    noButton.onclick = () => close(false);
+                    modal.classList.remove('hidden');
+                });
+            }
+            
             async function submitTrade(event) {
                 event.preventDefault();
                 const formData = new FormData(event.target);
                 const trade = Object.fromEntries(formData);
                 
-                if (confirm(`Place ${trade.side.toUpperCase()} order for $${trade.amount} USD of ${trade.symbol}?`)) {
+                if (await confirmAction(`Place ${trade.side.toUpperCase()} order for $${trade.amount} USD of ${trade.symbol}?`)) {
                     try {
                         const result = await fetchAPI('/api/orders', {
                             method: 'POST',
@@ -888,33 +1158,69 @@ def get_trading_page():
                 return false;
             }
             
+            // Cursor of the newest order change on screen; later loads only fetch what came after it
+            let lastOrderSeq = 0;
+            const orderRows = new Map(); // order id -> <tr>
+            
+            function fillOrderRow(row, order) {
+                row.querySelector('.sym').textContent = order.symbol;
+                row.querySelector('.side').textContent = order.side;
+                row.querySelector('.amt').textContent = order.amount;
+                row.querySelector('.price').textContent = order.price_str;
+                const status = row.querySelector('.status-indicator');
+                const filled = order.status === 'FILLED';
+                status.classList.toggle('status-real', filled);
+                status.classList.toggle('status-mock', !filled);
+                status.textContent = order.status;
+                row.querySelector('.cur').textContent = order.current_price_str || 'Loading...';
+            }
+            
+            // Rows are cloned from the parsed <template> and filled in with textContent,
+            // so no HTML is parsed per order. Orders already on screen (changed since the
+            // last load) are updated in place; their Current Price cells follow the market stream
+            function buildOrderRows(orders) {
+                const template = document.getElementById('order-row-tmpl');
+                const fragment = document.createDocumentFragment();
+                for (const order of orders) {
+                    let row = orderRows.get(order.id);
+                    if (row) {
+                        fillOrderRow(row, order);
+                        continue;
+                    }
+                    row = template.content.firstElementChild.cloneNode(true);
+                    fillOrderRow(row, order);
+                    registerPriceCell(order.symbol, row.querySelector('.cur'));
+                    orderRows.set(order.id, row);
+                    fragment.appendChild(row);
+                }
+                return fragment;
+            }
+            
             async function loadOrders() {
                 try {
-                    const response = await fetchAPI('/api/orders');
-                    const ordersTable = document.getElementById('orders-table');
+                    const response = await fetchAPI(`/api/orders?since=${lastOrderSeq}`);
+                    const tbody = document.getElementById('orders-table').tBodies[0];
                     
-                    // Clear existing rows except header
-                    ordersTable.innerHTML = '<tr><th>Symbol</th><th>Side</th><th>Amount</th><th>Price</th><th>Status</th><th>Current Price</th></tr>';
-                    
-                    response.orders.forEach(order => {
-                        const row = ordersTable.insertRow();
-                        row.innerHTML = `
-                            <td>${order.symbol}</td>
-                            <td>${order.side}</td>
-                            <td>${order.amount}</td>
-                            <td>$${parseFloat(order.price).toLocaleString()}</td>
-                            <td><span class="status-indicator ${order.status === 'FILLED' ? 'status-real' : 'status-mock'}">${order.status}</span></td>
-                            <td>${order.current_price ? '$' + order.current_price.toLocaleString() : 'Loading...'}</td>
-                        `;
-                    });
+                    if (lastOrderSeq === 0) {
+                        // First load replaces the placeholder row with every order in one DOM update
+                        tbody.replaceChildren(buildOrderRows(response.orders));
+                    } else if (response.orders.length) {
+                        // Later loads update changed rows and append only the new ones
+                        tbody.append(buildOrderRows(response.orders));
+                    }
+                    lastOrderSeq = response.last_seq;
                 } catch (error) {
                     console.error('Failed to load orders:', error);
                 }
             }
             
-            // Load orders when page loads
+            // Load orders when page loads, or once it is first shown if opened in a background tab
             document.addEventListener('DOMContentLoaded', function() {
-                loadOrders();
+                if (document.hidden) {
+                    document.addEventListener('visibilitychange', loadOrders, { once: true });
+                } else {
+                    loadOrders();
+                }
             });
         </script>
         """
@@ -995,7 +1301,7 @@ def get_settings_page():
                 <h3>📊 Data Sources</h3>
                 <table>
                     <tr><th>Service</th><th>Status</th><th>Last Updated</th></tr>
-                    <tr><td>CCXT Gateway</td><td id="ccxt-settings-status">⏳ Checking...</td><td class="last-updated">--</td></tr>
+                    <tr><td>CCXT Gateway</td><td><span id="ccxt-settings-indicator" class="status-indicator">⏳ Checking...</span></td><td class="last-updated">--</td></tr>
                     <tr><td>Market Data</td><td><span class="status-indicator status-real">Live</span></td><td class="last-updated">--</td></tr>
                     <tr><td>QuickChart</td><td><span class="status-indicator status-real">Available</span></td><td>--</td></tr>
                 </table>
@@ -1029,22 +1335,29 @@ def get_settings_page():
         </div>
         
         <script>
+            // Update the indicator span in place rather than re-parsing HTML
+            function setSettingsStatus(className, text) {
+                const indicator = document.getElementById('ccxt-settings-indicator');
+                indicator.className = className ? 'status-indicator ' + className : 'status-indicator';
+                indicator.textContent = text;
+            }
+            
             async function testConnections() {
-                const statusElement = document.getElementById('ccxt-settings-status');
-                statusElement.innerHTML = '⏳ Testing...';
+                setSettingsStatus('', '⏳ Testing...');
                 
                 try {
-                    const status = await fetchAPI('/api/ccxt-status');
+                    // An explicit test bypasses the server's short status cache
+                    const status = await getCcxtStatus(true);
                     
                     if (status.status === 'healthy') {
-                        statusElement.innerHTML = '<span class="status-indicator status-real">✅ Connected</span>';
+                        setSettingsStatus('status-real', '✅ Connected');
                         showNotification('All connections successful!', 'success');
                     } else {
-                        statusElement.innerHTML = '<span class="status-indicator status-mock">⚠️ Issues</span>';
+                        setSettingsStatus('status-mock', '⚠️ Issues');
                         showNotification('Some connection issues detected', 'warning');
                     }
                 } catch (error) {
-                    statusElement.innerHTML = '<span class="status-indicator status-error">❌ Failed</span>';
+                    setSettingsStatus('status-error', '❌ Failed');
                     showNotification('Connection test failed', 'error');
                 }
             }
@@ -1052,15 +1365,121 @@ def get_settings_page():
         """
     )
 
+def build_page_variant(
+    body: bytes,
+    etag: str,
+    cache_control: str,
+    content_encoding: Optional[str] = None,
+    media_type: str = "text/html"
+) -> PageVariant:
+    """Build the 200 and 304 responses for one encoding of a page or asset"""
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+    not_modified = Response(status_code=304, headers=headers)
+    if content_encoding:
+        headers["Content-Encoding"] = content_encoding
+    return PageVariant(
+        etag=etag.encode("latin-1"),
+        response=Response(body, media_type=media_type, headers=headers),
+        not_modified=not_modified
+    )
+
+def prerender_bytes(body: bytes, cache_control: str, media_type: str = "text/html") -> PrerenderedPage:
+    """Gzip a body once and build its responses"""
+    digest = hashlib.md5(body).hexdigest()
+    return PrerenderedPage(
+        identity=build_page_variant(body, f'"{digest}"', cache_control, media_type=media_type),
+        gzip=build_page_variant(
+            gzip.compress(body, compresslevel=9), f'"{digest}-gzip"', cache_control, "gzip", media_type
+        )
+    )
+
+def prerender_page(html: str, cache_control: str = PAGE_CACHE_CONTROL) -> PrerenderedPage:
+    """Encode and gzip a page once and build its responses"""
+    return prerender_bytes(html.encode("utf-8"), cache_control)
+
+# Shared page assets are served from memory under content-hashed names, so browsers
+# can keep them forever and a changed file simply gets a new URL
+STATIC_DIR = current_dir / "static"
+ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+static_assets: Dict[str, PrerenderedPage] = {}
+
+def register_static_asset(relative_path: str, media_type: str) -> str:
+    """Prerender a file under static/ and return its content-hashed URL"""
+    body = (STATIC_DIR / relative_path).read_bytes()
+    stem, suffix = os.path.splitext(os.path.basename(relative_path))
+    name = f"{stem}.{hashlib.md5(body).hexdigest()[:12]}{suffix}"
+    static_assets[name] = prerender_bytes(body, ASSET_CACHE_CONTROL, media_type)
+    return f"/static/{name}"
+
+APP_CSS_URL = register_static_asset("css/app.css", "text/css")
+APP_JS_URL = register_static_asset("js/app.js", "text/javascript")
+
+@app.get("/static/{name}", include_in_schema=False)
+async def static_asset(request: Request, name: str):
+    asset = static_assets.get(name)
+    if asset is None:
+        raise HTTPException(status_code=404)
+    return page_response(request, asset)
+
+# Pages are static, so render them once at import instead of per request
+LOGIN_PAGE = prerender_page(get_login_page(), PUBLIC_PAGE_CACHE_CONTROL)
+LOGIN_INVALID_CREDENTIALS_RESPONSE = HTMLResponse(get_login_page(error="Invalid credentials").encode("utf-8"))
+DASHBOARD_PAGE = prerender_page(get_dashboard_page())
+TRADING_PAGE = prerender_page(get_trading_page())
+STRATEGIES_PAGE = prerender_page(get_strategies_page())
+SETTINGS_PAGE = prerender_page(get_settings_page())
+
+def protected_page_route(page: PrerenderedPage):
+    """Build a route handler bound to one prerendered page"""
+    async def handler(request: Request):
+        return protected_page_response(request, page)
+    return handler
+
+for path, name, page in (
+    ("/dashboard", "dashboard", DASHBOARD_PAGE),
+    ("/trading", "trading", TRADING_PAGE),
+    ("/strategies", "strategies", STRATEGIES_PAGE),
+    ("/settings", "settings", SETTINGS_PAGE),
+):
+    app.add_api_route(path, protected_page_route(page), methods=["GET"], name=name, response_class=HTMLResponse)
+
+# Prefer uvloop/httptools (shipped with uvicorn[standard]) where the platform has them
+try:
+    import uvloop  # noqa: F401
+    UVICORN_LOOP = "uvloop"
+except ImportError:
+    UVICORN_LOOP = "asyncio"
+
+try:
+    import httptools  # noqa: F401
+    UVICORN_HTTP = "httptools"
+except ImportError:
+    UVICORN_HTTP = "h11"
+
+# uvicorn needs an import string (not the app object) for reload or several workers
+APP_IMPORT_STRING = "interfaces.web.app:app"
+
+# Login sessions live in process memory, so more than one worker needs sticky sessions
+WEB_WORKERS = int(os.getenv("WEB_WORKERS", "1"))
+
 # This is the function the startup script expects
-def run_web_app(host: str = "0.0.0.0", port: int = 5000, debug: bool = False):
+def run_web_app(host: str = "0.0.0.0", port: int = 5000, debug: bool = False, workers: int = WEB_WORKERS):
     """Run the web application with real data integration"""
     try:
-        logger.info(f"Starting Trading Bot Web App with Real Market Data Integration")
-        logger.info(f"CCXT Gateway: {os.getenv('CCXT_GATEWAY_URL', 'http://ccxt-bridge:3000')}")
-        uvicorn.run(app, host=host, port=port, reload=debug, log_level="info")
+        logger.info("Starting Trading Bot Web App with Real Market Data Integration")
+        logger.info("CCXT Gateway: %s", CCXT_GATEWAY_URL)
+        uvicorn.run(
+            APP_IMPORT_STRING,
+            host=host,
+            port=port,
+            reload=debug,
+            workers=1 if debug else workers,
+            log_level="info",
+            loop=UVICORN_LOOP,
+            http=UVICORN_HTTP
+        )
     except Exception as e:
-        logger.error(f"Failed to start web application: {e}")
+        logger.error("Failed to start web application: %s", e)
         raise
 
 if __name__ == "__main__":
@@ -8,18 +8,25 @@ Connects UI to actual trading engine, database, and API clients
 import asyncio
 import json
 import os
+import secrets
 import sys
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set, Tuple, Awaitable, Callable
 import logging
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, Form, HTTPException, Depends, WebSocket, WebSocketDisconnect, BackgroundTasks
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, RedirectResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import redis.asyncio as aioredis
+import numpy as np
+import orjson
 import uvicorn
 
 # Setup paths
@@ -33,6 +40,7 @@ try:
     from src.api_clients.ccxt_client import CCXTClient
     from src.api_clients.quickchart_client import QuickChartClient
     from src.database.repositories import UserRepository, TradeRepository, StrategyRepository, ExchangeRepository
+    from src.database.connection import init_database, close_database
     from src.strategies.strategy_manager import StrategyManager
     from src.core.risk_manager import RiskManager
     BACKEND_AVAILABLE = True
@@ -46,10 +54,25 @@ except ImportError as e:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Bring the backend up before serving requests and release it on shutdown"""
+    global market_pump_task
+    await initialize_backend()
+    market_pump_task = asyncio.create_task(market_data_pump())
+    yield
+    market_pump_task.cancel()
+    if redis_client is not None:
+        await redis_client.close()
+    if BACKEND_AVAILABLE:
+        await close_database()
+
 app = FastAPI(
     title="Light Trading Bot",
     description="Advanced Trading Automation Platform",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -74,14 +97,48 @@ strategy_repo = None
 exchange_repo = None
 strategy_manager = None
 risk_manager = None
+redis_client: Optional[aioredis.Redis] = None
+
+# Short timeouts keep an unreachable Redis from stalling startup or requests;
+# after a failure Redis is skipped for REDIS_RETRY_SECONDS, then tried again
+REDIS_SOCKET_TIMEOUT = 0.5
+REDIS_RETRY_SECONDS = 5
+_redis_retry_at = 0.0
+
+def mark_redis_failed(action: str, error: Exception) -> None:
+    """Back off from Redis; sessions created meanwhile are only visible to this worker"""
+    global _redis_retry_at
+    _redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+    logger.error(f"❌ Redis {action} failed, using in-process sessions for {REDIS_RETRY_SECONDS}s: {error}")
+
+def session_redis() -> Optional[aioredis.Redis]:
+    """The session Redis client, or None while backing off after a failure"""
+    if redis_client is None or time.monotonic() < _redis_retry_at:
+        return None
+    return redis_client
+
+async def connect_redis() -> aioredis.Redis:
+    """Connect the session store; the client is kept even if Redis is down so it can recover"""
+    client = aioredis.from_url(
+        os.getenv('REDIS_URL', 'redis://redis:6379/0'),
+        socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+        socket_timeout=REDIS_SOCKET_TIMEOUT
+    )
+    try:
+        await client.ping()
+    except Exception as e:
+        mark_redis_failed("connect", e)
+    return client
 
 async def initialize_backend():
     """Initialize backend components if available"""
     global trading_engine, ccxt_client, quickchart_client
     global user_repo, trade_repo, strategy_repo, exchange_repo
-    global strategy_manager, risk_manager
+    global strategy_manager, risk_manager, redis_client
     
     if not BACKEND_AVAILABLE:
+        # Sessions live in Redis so every worker sees the same logins
+        redis_client = await connect_redis()
         return False
     
     try:
@@ -89,6 +146,12 @@ async def initialize_backend():
         ccxt_client = CCXTClient()
         quickchart_client = QuickChartClient()
         
+        # Redis and the shared pooled MongoDB client connect concurrently;
+        # every repository reuses the database pool
+        redis_client, database_connected = await asyncio.gather(connect_redis(), init_database())
+        if not database_connected:
+            logger.warning("⚠️  Database unavailable, repository calls will fall back")
+        
         # Initialize repositories
         user_repo = UserRepository()
         trade_repo = TradeRepository()
@@ -107,12 +170,6 @@ async def initialize_backend():
         logger.error(f"❌ Failed to initialize backend components: {e}")
         return False
 
-# Initialize backend on startup
-@app.on_event("startup")
-async def startup_event():
-    """Initialize backend components on startup"""
-    await initialize_backend()
-
 # Templates and static files
 templates_dir = current_dir / "templates"
 static_dir = current_dir / "static"
@@ -129,7 +186,9 @@ try:
 except Exception as e:
     logger.warning(f"Could not mount static files: {e}")
 
-# Session storage (enhanced with database integration)
+# Session storage: Redis, with an in-process fallback when Redis is unreachable
+SESSION_TTL = 24 * 60 * 60
+USER_CACHE_TTL = 60
 sessions = {}
 demo_user = {
     "id": "demo_user_123",
@@ -139,55 +198,128 @@ demo_user = {
 }
 
 # WebSocket connection manager
+BROADCAST_BATCH_SIZE = 50
+
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
 
-    async def send_personal_message(self, message: str, websocket: WebSocket):
-        await websocket.send_text(message)
+    async def send_personal_message(self, payload: bytes, websocket: WebSocket):
+        await websocket.send_bytes(payload)
 
-    async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except:
-                self.disconnect(connection)
+    async def broadcast(self, payload: bytes):
+        """Send one pre-encoded payload to every client in concurrent batches"""
+        connections = tuple(self.active_connections)
+        dead = []
+        
+        for start in range(0, len(connections), BROADCAST_BATCH_SIZE):
+            batch = connections[start:start + BROADCAST_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(connection.send_bytes(payload) for connection in batch),
+                return_exceptions=True
+            )
+            dead.extend(conn for conn, result in zip(batch, results) if isinstance(result, Exception))
+            # Let HTTP handlers run between batches
+            await asyncio.sleep(0)
+        
+        for connection in dead:
+            self.disconnect(connection)
 
 manager = ConnectionManager()
 
 # Authentication helpers (enhanced with database)
 async def create_session(user_id: str) -> str:
     """Create a new session"""
-    session_id = f"session_{user_id}_{datetime.now().timestamp()}"
+    session_id = secrets.token_urlsafe(32)
+    
+    client = session_redis()
+    if client is not None:
+        try:
+            await client.set(f"sess:{session_id}", json.dumps({"user_id": user_id}), ex=SESSION_TTL)
+            return session_id
+        except Exception as e:
+            mark_redis_failed("session write", e)
+    
+    now = time.time()
     sessions[session_id] = {
         "user_id": user_id,
-        "created_at": datetime.now(),
-        "expires_at": datetime.now() + timedelta(hours=24)
+        "created_at": now,
+        "expires_at": now + SESSION_TTL
     }
     return session_id
 
+async def get_session(session_id: str) -> Optional[Dict[str, Any]]:
+    """Look up a live session; Redis expires them, the fallback dict is checked by hand"""
+    client = session_redis()
+    if client is not None:
+        try:
+            raw = await client.get(f"sess:{session_id}")
+            if raw is not None:
+                return json.loads(raw)
+        except Exception as e:
+            mark_redis_failed("session read", e)
+    
+    session = sessions.get(session_id)
+    if not session or session["expires_at"] < time.time():
+        return None
+    return session
+
+async def delete_session(session_id: str) -> None:
+    """Drop a session from both stores"""
+    sessions.pop(session_id, None)
+    client = session_redis()
+    if client is not None:
+        try:
+            await client.delete(f"sess:{session_id}")
+        except Exception as e:
+            mark_redis_failed("session delete", e)
+
+async def get_session_user(user_id: str):
+    """Resolve a user, serving repeat lookups from a short-lived Redis copy"""
+    cache_key = f"user:{user_id}"
+    
+    client = session_redis()
+    if client is not None:
+        try:
+            cached = await client.get(cache_key)
+            if cached is not None:
+                return json.loads(cached)
+        except Exception as e:
+            mark_redis_failed("user read", e)
+            client = None
+    
+    user = await user_repo.find_by_id(user_id)
+    
+    if user and isinstance(user, dict) and client is not None:
+        try:
+            await client.set(cache_key, json.dumps(user, default=str), ex=USER_CACHE_TTL)
+        except Exception as e:
+            mark_redis_failed("user write", e)
+    
+    return user
+
 async def get_current_user(request: Request):
-    """Get current user from session (enhanced with database lookup)"""
+    """Dependency: the session user, resolved once per request and shared by every dependant"""
     session_id = request.cookies.get("session_id")
     
     if not session_id:
         return None
     
-    session = sessions.get(session_id)
-    if not session or session["expires_at"] < datetime.now():
+    session = await get_session(session_id)
+    if not session:
         return None
     
     # Try to get user from database first
     if BACKEND_AVAILABLE and user_repo:
         try:
-            user = await user_repo.find_by_id(session["user_id"])
+            user = await get_session_user(session["user_id"])
             if user:
                 return user
         except Exception as e:
@@ -196,7 +328,38 @@ async def get_current_user(request: Request):
     # Fallback to demo user
     return demo_user
 
+async def require_user(user: Optional[Dict[str, Any]] = Depends(get_current_user)) -> Dict[str, Any]:
+    """Dependency for API endpoints: the logged-in user, or 401"""
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return user
+
 # Enhanced API functions with real backend integration
+def aggregate_positions(trades: List[Any]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Net size and average buy price per symbol, computed column-wise over the trades.
+
+    Trades are repository models; the fill price is ``average_price`` or, for
+    limit orders, ``price``. Market orders with neither are skipped.
+    """
+    priced = [
+        (trade, fill_price) for trade in trades
+        if (fill_price := getattr(trade, "average_price", None) or getattr(trade, "price", None))
+    ]
+    count = len(priced)
+    symbols = np.array([trade.symbol for trade, _ in priced], dtype=str)
+    is_buy = np.fromiter((trade.side == "buy" for trade, _ in priced), dtype=bool, count=count)
+    amounts = np.fromiter((float(trade.amount) for trade, _ in priced), dtype=np.float64, count=count)
+    prices = np.fromiter((float(fill_price) for _, fill_price in priced), dtype=np.float64, count=count)
+    
+    unique_symbols, index = np.unique(symbols, return_inverse=True)
+    sizes = np.bincount(index, weights=np.where(is_buy, amounts, -amounts))
+    bought = np.bincount(index, weights=amounts * is_buy)
+    cost = np.bincount(index, weights=amounts * prices * is_buy)
+    avg_prices = np.divide(cost, bought, out=np.zeros(cost.shape), where=bought > 0)
+    
+    held = sizes > 0
+    return unique_symbols[held].tolist(), sizes[held], avg_prices[held]
+
 async def get_real_portfolio(user_id: str) -> Dict[str, Any]:
     """Get real portfolio data from exchanges"""
     if not BACKEND_AVAILABLE or not ccxt_client:
@@ -220,16 +383,38 @@ async def get_real_portfolio(user_id: str) -> Dict[str, Any]:
         
         # Get positions from database
         positions = []
+        total_pnl = total_pnl_pct = 0.0
         if trade_repo:
             recent_trades = await trade_repo.get_user_trades(user_id, limit=10)
-            # Calculate positions from trades (simplified)
+            if recent_trades:
+                # Calculate positions from trades (simplified)
+                symbols, sizes, avg_prices = aggregate_positions(recent_trades)
+                tickers = await asyncio.gather(*(get_real_market_data(symbol) for symbol in symbols))
+                current_prices = np.fromiter((ticker["price"] for ticker in tickers), dtype=np.float64, count=len(symbols))
+                pnl = (current_prices - avg_prices) * sizes
+                
+                cost_basis = float(np.dot(avg_prices, sizes))
+                total_pnl = float(pnl.sum())
+                total_pnl_pct = total_pnl / cost_basis * 100 if cost_basis > 0 else 0.0
+                positions = [
+                    {
+                        "symbol": symbol,
+                        "size": size,
+                        "avg_price": avg_price,
+                        "current_price": current_price,
+                        "unrealized_pnl": position_pnl
+                    }
+                    for symbol, size, avg_price, current_price, position_pnl in zip(
+                        symbols, sizes.tolist(), avg_prices.tolist(), current_prices.tolist(), pnl.tolist()
+                    )
+                ]
             
         return {
             "total_balance": total_balance,
             "available_balance": free_balance,
             "invested_balance": total_balance - free_balance,
-            "total_pnl": 0.0,  # Calculate from trades
-            "total_pnl_pct": 0.0,
+            "total_pnl": total_pnl,
+            "total_pnl_pct": total_pnl_pct,
             "positions": positions
         }
         
@@ -245,7 +430,35 @@ async def get_real_portfolio(user_id: str) -> Dict[str, Any]:
             "positions": []
         }
 
+# Ticker cache: concurrent callers for a symbol share one upstream fetch
+MARKET_DATA_TTL = 1.0
+# Symbols come from a public query parameter, so the cache is a bounded LRU
+MAX_TICKER_CACHE = 256
+_ticker_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_ticker_inflight: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+
 async def get_real_market_data(symbol: str = "BTC/USDT") -> Dict[str, Any]:
+    """Get market data, reusing a fetch younger than MARKET_DATA_TTL"""
+    cached = _ticker_cache.get(symbol)
+    if cached and time.monotonic() - cached[0] < MARKET_DATA_TTL:
+        _ticker_cache.move_to_end(symbol)
+        return cached[1]
+    
+    task = _ticker_inflight.get(symbol)
+    if task is None:
+        task = asyncio.create_task(fetch_market_data(symbol))
+        _ticker_inflight[symbol] = task
+        task.add_done_callback(lambda _: _ticker_inflight.pop(symbol, None))
+    
+    # Shield so one cancelled request doesn't cancel the fetch for the others
+    data = await asyncio.shield(task)
+    _ticker_cache[symbol] = (time.monotonic(), data)
+    _ticker_cache.move_to_end(symbol)
+    while len(_ticker_cache) > MAX_TICKER_CACHE:
+        _ticker_cache.popitem(last=False)
+    return data
+
+async def fetch_market_data(symbol: str) -> Dict[str, Any]:
     """Get real market data from ccxt-gateway"""
     if not BACKEND_AVAILABLE or not ccxt_client:
         # Fallback to mock data
@@ -326,10 +539,11 @@ async def place_real_trade(user_id: str, trade_data: Dict[str, Any]) -> Dict[str
         await trade_repo.create_trade(trade_record)
         
         # Broadcast update to connected WebSocket clients
-        await manager.broadcast(json.dumps({
+        payload = orjson.dumps({
             "type": "trade_update",
             "data": trade_record
-        }))
+        })
+        await manager.broadcast(payload)
         
         return {
             "status": "success",
@@ -493,18 +707,21 @@ def get_base_template():
     <script>
         // WebSocket connection for real-time updates
         let ws;
+        const wsDecoder = new TextDecoder();
         
         function connectWebSocket() {
             const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
             ws = new WebSocket(`${protocol}//${window.location.host}/ws`);
+            // Broadcasts arrive as pre-encoded binary frames
+            ws.binaryType = 'arraybuffer';
             
             ws.onopen = function(event) {
                 console.log('WebSocket connected');
             };
             
             ws.onmessage = function(event) {
-                const data = JSON.parse(event.data);
-                handleWebSocketMessage(data);
+                const text = typeof event.data === 'string' ? event.data : wsDecoder.decode(event.data);
+                handleWebSocketMessage(JSON.parse(text));
             };
             
             ws.onclose = function(event) {
@@ -578,18 +795,6 @@ def get_base_template():
             }
         }
         
-        // Auto-refresh data every 30 seconds
-        setInterval(async () => {
-            if (window.location.pathname !== '/login') {
-                try {
-                    const portfolio = await fetchAPI('/api/portfolio');
-                    updatePortfolio(portfolio);
-                } catch (error) {
-                    console.error('Failed to refresh data:', error);
-                }
-            }
-        }, 30000);
-        
         // Initialize WebSocket connection
         if (window.location.pathname !== '/login') {
             connectWebSocket();
@@ -599,24 +804,45 @@ def get_base_template():
 </html>
     """
 
+# The base template is split once at import; pages are assembled with one join
+_TITLE_BLOCK = '{% block title %}Trading Bot{% endblock %}'
+_CONTENT_BLOCK = '{% block content %}{% endblock %}'
+_BASE_HEAD, _base_rest = get_base_template().split(_TITLE_BLOCK)
+_BASE_MIDDLE, _BASE_TAIL = _base_rest.split(_CONTENT_BLOCK)
+
+def render_page(title: str, content: str) -> str:
+    """Fill the base template's title and content blocks"""
+    return "".join((_BASE_HEAD, title, _BASE_MIDDLE, content, _BASE_TAIL))
+
+def stream_page(title: str, build_content: Callable[..., Awaitable[str]], *args: Any) -> StreamingResponse:
+    """Send the page head straight away so the browser can parse the styles
+    while the content's data is still being fetched"""
+    async def body():
+        yield _BASE_HEAD + title + _BASE_MIDDLE
+        yield await build_content(*args)
+        yield _BASE_TAIL
+    
+    return StreamingResponse(body(), media_type="text/html")
+
 # Enhanced Routes with Backend Integration
 
 @app.get("/", response_class=HTMLResponse)
-async def dashboard(request: Request):
-    user = await get_current_user(request)
+async def dashboard(user: Optional[Dict[str, Any]] = Depends(get_current_user)):
     if not user:
         return RedirectResponse(url="/login")
     
-    # Get real portfolio data
-    portfolio = await get_real_portfolio(user["id"])
-    
-    # Get real market data for major pairs
-    btc_data = await get_real_market_data("BTC/USDT")
-    eth_data = await get_real_market_data("ETH/USDT")
+    return stream_page('Dashboard - Trading Bot', render_dashboard_content, user)
+
+async def render_dashboard_content(user: Dict[str, Any]) -> str:
+    """Page body; built after the head has already been sent"""
+    # Get real portfolio and market data for major pairs concurrently
+    portfolio, btc_data, eth_data = await asyncio.gather(
+        get_real_portfolio(user["id"]),
+        get_real_market_data("BTC/USDT"),
+        get_real_market_data("ETH/USDT")
+    )
     
-    html_content = f"""
-    {get_base_template().replace('{% block title %}Trading Bot{% endblock %}', 'Dashboard - Trading Bot')}
-    """.replace('{% block content %}', f"""
+    return f"""
     <h1>📊 Trading Dashboard</h1>
     
     <div class="grid grid-4">
@@ -685,16 +911,12 @@ async def dashboard(request: Request):
             </table>
         </div>
     </div>
-    """).replace('{% endblock %}', '')
-    
-    return HTMLResponse(html_content)
+    """
 
 @app.get("/login", response_class=HTMLResponse)
 async def login_page(request: Request):
     # Same login page as before
-    html_content = f"""
-    {get_base_template().replace('{% block title %}Trading Bot{% endblock %}', 'Login - Trading Bot')}
-    """.replace('{% block content %}', """
+    html_content = render_page('Login - Trading Bot', """
     <div style="max-width: 400px; margin: 5rem auto;">
         <div class="card">
             <h2 style="text-align: center; margin-bottom: 2rem;">🔐 Login to Trading Bot</h2>
@@ -722,7 +944,7 @@ async def login_page(request: Request):
             </div>
         </div>
     </div>
-    """).replace('{% endblock %}', '')
+    """)
     
     return HTMLResponse(html_content)
 
@@ -752,21 +974,30 @@ async def login_submit(username: str = Form(...), password: str = Form(...)):
     raise HTTPException(status_code=401, detail="Invalid credentials")
 
 @app.get("/logout")
-async def logout():
+async def logout(request: Request):
+    session_id = request.cookies.get("session_id")
+    if session_id:
+        await delete_session(session_id)
+    
     response = RedirectResponse(url="/login")
     response.delete_cookie(key="session_id")
     return response
 
 # Enhanced Trading Interface
 @app.get("/trading", response_class=HTMLResponse)
-async def trading_page(request: Request):
-    user = await get_current_user(request)
+async def trading_page(user: Optional[Dict[str, Any]] = Depends(get_current_user)):
     if not user:
         return RedirectResponse(url="/login")
     
+    return stream_page('Trading - Trading Bot', render_trading_content, user)
+
+async def render_trading_content(user: Dict[str, Any]) -> str:
+    """Page body; built after the head has already been sent"""
     # Get real market data
-    btc_data = await get_real_market_data("BTC/USDT")
-    eth_data = await get_real_market_data("ETH/USDT")
+    btc_data, eth_data = await asyncio.gather(
+        get_real_market_data("BTC/USDT"),
+        get_real_market_data("ETH/USDT")
+    )
     
     # Get real orders and trades if available
     orders_data = []
@@ -774,14 +1005,14 @@ async def trading_page(request: Request):
     
     if BACKEND_AVAILABLE and trade_repo:
         try:
-            orders_data = await trade_repo.get_user_orders(user["id"], status="open")
-            trades_data = await trade_repo.get_user_trades(user["id"], limit=10)
+            orders_data, trades_data = await asyncio.gather(
+                trade_repo.get_user_orders(user["id"], status="open"),
+                trade_repo.get_user_trades(user["id"], limit=10)
+            )
         except Exception as e:
             logger.warning(f"Failed to get orders/trades: {e}")
     
-    html_content = f"""
-    {get_base_template().replace('{% block title %}Trading Bot{% endblock %}', 'Trading - Trading Bot')}
-    """.replace('{% block content %}', f"""
+    return f"""
     <h1>💰 Trading Interface</h1>
     
     <div class="grid grid-2">
@@ -945,18 +1176,12 @@ async def trading_page(request: Request):
             }}
         }}
     </script>
-    """).replace('{% endblock %}', '')
-    
-    return HTMLResponse(html_content)
+    """
 
 # Enhanced API Endpoints with Real Backend Integration
 
 @app.get("/api/portfolio")
-async def get_portfolio_api(request: Request):
-    user = await get_current_user(request)
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    
+async def get_portfolio_api(user: Dict[str, Any] = Depends(require_user)):
     portfolio = await get_real_portfolio(user["id"])
     return portfolio
 
@@ -966,20 +1191,12 @@ async def get_market_data_api(symbol: str = "BTC/USDT"):
     return market_data
 
 @app.post("/api/trade")
-async def place_trade_api(trade_data: dict, request: Request):
-    user = await get_current_user(request)
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    
+async def place_trade_api(trade_data: dict, user: Dict[str, Any] = Depends(require_user)):
     result = await place_real_trade(user["id"], trade_data)
     return result
 
 @app.get("/api/orders")
-async def get_orders_api(request: Request):
-    user = await get_current_user(request)
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    
+async def get_orders_api(user: Dict[str, Any] = Depends(require_user)):
     if BACKEND_AVAILABLE and trade_repo:
         try:
             orders = await trade_repo.get_user_orders(user["id"])
@@ -990,11 +1207,7 @@ async def get_orders_api(request: Request):
     return []
 
 @app.post("/api/orders/{order_id}/cancel")
-async def cancel_order_api(order_id: str, request: Request):
-    user = await get_current_user(request)
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    
+async def cancel_order_api(order_id: str, user: Dict[str, Any] = Depends(require_user)):
     if BACKEND_AVAILABLE and ccxt_client:
         try:
             result = await ccxt_client.cancel_order(order_id)
@@ -1005,20 +1218,42 @@ async def cancel_order_api(order_id: str, request: Request):
     
     return {"status": "success", "message": "Order cancelled (simulated)"}
 
+# Server-pushed market data: one fetch per interval, broadcast to every client
+MARKET_PUSH_INTERVAL = 5
+MARKET_PUSH_SYMBOLS = ("BTC/USDT", "ETH/USDT")
+market_pump_task: Optional[asyncio.Task] = None
+
+async def market_data_pump():
+    """Broadcast fresh tickers to connected WebSocket clients"""
+    while True:
+        await asyncio.sleep(MARKET_PUSH_INTERVAL)
+        if not manager.active_connections:
+            continue
+        
+        try:
+            tickers = await asyncio.gather(*(get_real_market_data(symbol) for symbol in MARKET_PUSH_SYMBOLS))
+            for ticker in tickers:
+                await manager.broadcast(orjson.dumps({
+                    "type": "price_update",
+                    "data": ticker
+                }))
+        except Exception as e:
+            logger.error(f"Market data push failed: {e}")
+
 # WebSocket endpoint for real-time updates
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
     try:
+        # Send the current price right away; later updates come from market_data_pump
+        btc_data = await get_real_market_data("BTC/USDT")
+        await manager.send_personal_message(orjson.dumps({
+            "type": "price_update",
+            "data": btc_data
+        }), websocket)
+        
         while True:
-            # Send periodic market data updates
-            btc_data = await get_real_market_data("BTC/USDT")
-            await manager.send_personal_message(json.dumps({
-                "type": "price_update",
-                "data": btc_data
-            }), websocket)
-            
-            await asyncio.sleep(5)  # Update every 5 seconds
+            await websocket.receive_text()
             
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -0,0 +1,239 @@
+// src/interfaces/web/static/js/app.js
+
+/**
+ * Shared page script for the pages rendered by app.py:
+ * live market stream, price formatting, notifications and API helper
+ */
+
+let marketDataStream = null;
+let lastMarketData = {};
+
+function handleMarketPayload(payload) {
+    const data = JSON.parse(payload);
+    queueMarketData(data.data);
+    lastMarketData = data.data;
+}
+
+function openMarketStream(onPayload) {
+    // Server push over one HTTP connection; EventSource reconnects on its own
+    marketDataStream = new EventSource('/api/stream');
+    marketDataStream.addEventListener('market_update', event => onPayload(event.data));
+}
+
+function connectMarketStream() {
+    if (!('locks' in navigator) || !('BroadcastChannel' in window)) {
+        // No way to coordinate tabs: each one streams for itself
+        openMarketStream(handleMarketPayload);
+        return;
+    }
+
+    // One tab (the lock holder) owns the stream and relays it to the others.
+    // The lock is released when that tab closes, and the next tab takes over
+    const channel = new BroadcastChannel('trading-bot-market');
+    let leaderPayload = null;
+
+    channel.onmessage = event => {
+        if (event.data === 'sync') {
+            // A new tab asks for the latest snapshot instead of waiting for the next update
+            if (leaderPayload) channel.postMessage(leaderPayload);
+        } else {
+            handleMarketPayload(event.data);
+        }
+    };
+    channel.postMessage('sync');
+
+    navigator.locks.request('trading-bot-market-stream', () => new Promise(() => {
+        openMarketStream(payload => {
+            leaderPayload = payload;
+            handleMarketPayload(payload);
+            channel.postMessage(payload);
+        });
+    }));
+}
+
+// Keep only the newest tick per symbol and paint once per animation frame,
+// so bursts of updates never queue up stale DOM writes
+// Painting waits while every .live-market-card is scrolled out of view (and
+// requestAnimationFrame already pauses in hidden tabs); the newest ticks are kept
+// and painted once a card comes back
+const pendingTicks = new Map();
+let flushScheduled = false;
+let marketCardsVisible = true;
+
+function queueMarketData(marketData) {
+    for (const [symbol, data] of Object.entries(marketData)) {
+        pendingTicks.set(symbol, data);
+    }
+    scheduleMarketFlush();
+}
+
+function scheduleMarketFlush() {
+    if (!flushScheduled && marketCardsVisible && pendingTicks.size) {
+        flushScheduled = true;
+        requestAnimationFrame(flushMarketData);
+    }
+}
+
+function observeMarketCards() {
+    const cards = document.querySelectorAll('.live-market-card');
+    if (!cards.length || !('IntersectionObserver' in window)) return;
+
+    const visibleCards = new Set();
+    const observer = new IntersectionObserver(entries => {
+        for (const entry of entries) {
+            if (entry.isIntersecting) visibleCards.add(entry.target);
+            else visibleCards.delete(entry.target);
+        }
+        marketCardsVisible = visibleCards.size > 0;
+        scheduleMarketFlush();
+    });
+    cards.forEach(card => observer.observe(card));
+}
+
+function flushMarketData() {
+    flushScheduled = false;
+    const batch = Object.fromEntries(pendingTicks);
+    pendingTicks.clear();
+    updateMarketData(batch);
+}
+
+// One shared currency formatter; formatted strings are memoized per value
+const MONEY_FORMAT = new Intl.NumberFormat('en-US', { style: 'currency', currency: 'USD' });
+const moneyCache = new Map();
+
+function money(value) {
+    let formatted = moneyCache.get(value);
+    if (formatted === undefined) {
+        if (moneyCache.size >= 1000) moneyCache.clear();
+        formatted = MONEY_FORMAT.format(value);
+        moneyCache.set(value, formatted);
+    }
+    return formatted;
+}
+
+// DOM lookups done once at load, not on every tick
+const els = { priceCells: new Map(), changeCells: new Map(), lastUpdated: [], notification: null };
+
+function groupBySymbol(selector, key) {
+    const groups = new Map();
+    document.querySelectorAll(selector).forEach(element => {
+        const symbol = element.dataset[key];
+        if (!groups.has(symbol)) groups.set(symbol, []);
+        groups.get(symbol).push(element);
+    });
+    return groups;
+}
+
+function cacheElements() {
+    els.priceCells = groupBySymbol('[data-symbol]', 'symbol');
+    els.changeCells = groupBySymbol('[data-change]', 'change');
+    els.lastUpdated = document.querySelectorAll('.last-updated');
+    els.notification = document.getElementById('notification');
+}
+
+// Price cells added after load (e.g. order rows) join the per-symbol paint list
+function registerPriceCell(symbol, element) {
+    if (!els.priceCells.has(symbol)) els.priceCells.set(symbol, []);
+    els.priceCells.get(symbol).push(element);
+}
+
+// Last painted price per symbol, so price moves are detected without reading the DOM
+const paintedPrices = new Map();
+
+function updateMarketData(marketData) {
+    // Work out every change first, then apply them in one pass: no DOM reads between writes
+    const writes = [];
+    for (const [symbol, data] of Object.entries(marketData)) {
+        const newPrice = data.price;
+        const oldPrice = paintedPrices.get(symbol);
+        paintedPrices.set(symbol, newPrice);
+
+        // Color flash for a price change
+        const flash = oldPrice && oldPrice !== newPrice ? (newPrice > oldPrice ? 'price-up' : 'price-down') : null;
+        const priceText = money(newPrice);
+        for (const element of els.priceCells.get(symbol) || []) {
+            writes.push({ element, text: priceText, flash });
+        }
+
+        // Change percentage
+        const change = data.change_24h_pct || 0;
+        const changeText = `${change >= 0 ? '+' : ''}${change.toFixed(2)}%`;
+        const trend = change >= 0 ? 'price-up' : 'price-down';
+        for (const element of els.changeCells.get(symbol) || []) {
+            writes.push({ element, text: changeText, trend });
+        }
+    }
+    const updatedText = `Last updated: ${new Date().toLocaleTimeString()}`;
+
+    for (const { element, text, flash, trend } of writes) {
+        element.textContent = text;
+        const colorClass = flash || trend;
+        if (colorClass) {
+            // classList keeps the element's own classes (e.g. metric-value)
+            element.classList.remove('price-up', 'price-down');
+            element.classList.add(colorClass);
+        }
+        if (flash) {
+            setTimeout(() => element.classList.remove(flash), 2000);
+        }
+    }
+    els.lastUpdated.forEach(element => {
+        element.textContent = updatedText;
+    });
+}
+
+function showNotification(message, type = 'success') {
+    const notification = els.notification || document.getElementById('notification');
+    notification.textContent = message;
+    notification.className = 'notification ' + type;
+    notification.style.display = 'block';
+    setTimeout(() => { notification.style.display = 'none'; }, 5000);
+}
+
+async function fetchAPI(url, options = {}) {
+    try {
+        const response = await fetch(url, {
+            // Writes (trades, refreshes) are small, so let them finish even if the user navigates away
+            keepalive: Boolean(options.method && options.method !== 'GET'),
+            ...options,
+            headers: { 'Accept': 'application/json', 'Content-Type': 'application/json', ...options.headers }
+        });
+        if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
+        return await response.json();
+    } catch (error) {
+        console.error('API Error:', error);
+        showNotification('API Error: ' + error.message, 'error');
+        throw error;
+    }
+}
+
+// Callers asking while a status request is still pending share its result
+let ccxtStatusRequest = null;
+
+function getCcxtStatus(force = false) {
+    if (!ccxtStatusRequest) {
+        ccxtStatusRequest = fetchAPI(force ? '/api/ccxt-status?force=1' : '/api/ccxt-status')
+            .finally(() => { ccxtStatusRequest = null; });
+    }
+    return ccxtStatusRequest;
+}
+
+async function refreshMarketData() {
+    try {
+        showNotification('Refreshing market data...', 'info');
+        const result = await fetchAPI('/api/refresh-market-data', { method: 'POST' });
+        showNotification(`Market data refreshed: ${result.symbols_updated} symbols updated`);
+
+        // Update display on the next frame
+        queueMarketData(result.data);
+    } catch (error) {
+        showNotification('Failed to refresh market data', 'error');
+    }
+}
+
+// Subscribe to market updates when page loads
+document.addEventListener('DOMContentLoaded', function() {
+    cacheElements();
+    observeMarketCards();
+    connectMarketStream();
+});
@@ -0,0 +1,98 @@
+# src/interfaces/web/static_files.py
+
+"""
+In-memory static file serving for the web interface
+Small assets are read once at startup and served without disk I/O
+"""
+
+import hashlib
+import logging
+import mimetypes
+import os
+from typing import Dict, NamedTuple, Optional
+
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+logger = logging.getLogger(__name__)
+
+# Larger files fall back to StaticFiles' streaming FileResponse
+MAX_PRELOAD_SIZE = 1024 * 1024
+STATIC_CACHE_CONTROL = "public, max-age=3600"
+
+class PreloadedFile(NamedTuple):
+    body: bytes
+    gzip_body: Optional[bytes]
+    media_type: str
+    etag: str
+
+class InMemoryStaticFiles(StaticFiles):
+    """StaticFiles that serves small assets from memory.
+
+    A ``<name>.gz`` file next to an asset is used as its precompressed
+    body for clients that accept gzip.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.preloaded: Dict[str, PreloadedFile] = {}
+        if self.directory is not None:
+            self._preload(str(self.directory))
+
+    def _preload(self, root: str) -> None:
+        """Read every small file under root into memory"""
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                full_path = os.path.join(dirpath, filename)
+                if os.path.getsize(full_path) > MAX_PRELOAD_SIZE:
+                    continue
+
+                with open(full_path, 'rb') as f:
+                    body = f.read()
+
+                gzip_body = None
+                gzip_path = full_path + '.gz'
+                if os.path.isfile(gzip_path) and os.path.getsize(gzip_path) <= MAX_PRELOAD_SIZE:
+                    with open(gzip_path, 'rb') as f:
+                        gzip_body = f.read()
+
+                media_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+                relative_path = os.path.normpath(os.path.relpath(full_path, root))
+                self.preloaded[relative_path] = PreloadedFile(
+                    body=body,
+                    gzip_body=gzip_body,
+                    media_type=media_type,
+                    etag=f'"{hashlib.md5(body).hexdigest()}"'
+                )
+
+        logger.info(f"Preloaded {len(self.preloaded)} static files from {root}")
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """Serve preloaded files from memory, anything else from disk"""
+        preloaded = self.preloaded.get(path)
+        if preloaded is None or scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+
+        accept_encoding = if_none_match = b""
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept_encoding = value
+            elif name == b"if-none-match":
+                if_none_match = value
+
+        headers = {"ETag": preloaded.etag, "Cache-Control": STATIC_CACHE_CONTROL}
+        if if_none_match.decode("latin-1") == preloaded.etag:
+            return Response(status_code=304, headers=headers)
+
+        body = preloaded.body
+        if preloaded.gzip_body is not None:
+            headers["Vary"] = "Accept-Encoding"
+            if b"gzip" in accept_encoding:
+                body = preloaded.gzip_body
+                headers["Content-Encoding"] = "gzip"
+
+        if scope["method"] == "HEAD":
+            headers["Content-Length"] = str(len(body))
+            body = b""
+        return Response(body, media_type=preloaded.media_type, headers=headers)
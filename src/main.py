@@ -83,13 +83,12 @@ def start_web_interface(port: int):
     """Start the web interface server."""
     try:
         # Import web app
-        from interfaces.web.app import create_app
+        from interfaces.web.app import run_web_app
         
-        app = create_app()
         logger.info(f"Starting web interface on port {port}")
         
-        # Run Flask app
-        app.run(host='0.0.0.0', port=port, debug=False, threaded=True)
+        # Run FastAPI app
+        run_web_app(host='0.0.0.0', port=port)
         
     except ImportError as e:
         logger.error(f"Web interface not available: {e}")
@@ -9,6 +9,8 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from decimal import Decimal
 
+import numpy as np
+
 from ..database.repositories.trade_repository import TradeRepository
 from ..clients.ccxt_client import CCXTClient
 
@@ -139,6 +141,21 @@ def format_percentage(value: float, decimals: int = 2) -> str:
     except:
         return f"{value}%"
 
+def compute_usd_values(
+    balances: Dict[str, float],
+    prices: Dict[str, float]
+) -> Dict[str, float]:
+    """Convert asset amounts to USD values; assets without a price are worth 0"""
+    if not balances:
+        return {}
+    
+    assets = list(balances)
+    count = len(assets)
+    amounts = np.fromiter((balances[a] for a in assets), dtype=np.float64, count=count)
+    unit_prices = np.fromiter((prices.get(a, 0.0) for a in assets), dtype=np.float64, count=count)
+    
+    return dict(zip(assets, (amounts * unit_prices).tolist()))
+
 def calculate_win_rate(winning_trades: int, total_trades: int) -> float:
     """Calculate win rate percentage"""
     if total_trades == 0:
@@ -7,7 +7,7 @@ from click.testing import CliRunner
 import json
 
 from src.interfaces.cli.cli_main import cli, TradingBotCLI
-from src.interfaces.cli.utils import CLIFormatter, CLIValidator, CLIExporter
+from src.interfaces.cli.utils import CLIFormatter, CLIValidator, CLIExporter, CLIProgress, spinner
 from src.core.engine.mode_manager import TradingMode
 
 class TestTradingBotCLI:
@@ -174,6 +174,9 @@ class TestCLIValidator:
         assert CLIValidator.validate_symbol('BTCUSDT') == False
         assert CLIValidator.validate_symbol('') == False
         assert CLIValidator.validate_symbol('BTC/') == False
+        assert CLIValidator.validate_symbol('BTC/USDT:USDT') == True
+        assert CLIValidator.validate_symbol('1000-PEPE/USDT') == True
+        assert CLIValidator.validate_symbol('BTC/USDT:') == False
     
     def test_validate_amount(self):
         """Test amount validation"""
@@ -283,6 +286,37 @@ class TestCLIExporter:
         assert 'BTC/USDT' in content
         assert '15.00%' in content
 
+class TestCLIProgress:
+    """Test cases for CLI progress bar"""
+    
+    def test_progress_draws_final_state(self, capsys):
+        """Test progress bar always renders completion"""
+        progress = CLIProgress(total=1000, description="Loading")
+        for _ in range(1000):
+            progress.update()
+        
+        captured = capsys.readouterr()
+        assert "100.0%" in captured.out
+        assert "(1000/1000)" in captured.out
+        assert captured.out.endswith("\n")
+        # Redraws are throttled, so far fewer than 1000 frames are written
+        assert captured.out.count("\r") < 1000
+
+class TestSpinner:
+    """Test cases for the async CLI spinner"""
+    
+    @pytest.mark.asyncio
+    async def test_spinner_stops_with_block(self, capsys):
+        """Test spinner renders while the block runs and clears on exit"""
+        async with spinner("Loading"):
+            await asyncio.sleep(0.25)
+        
+        captured = capsys.readouterr()
+        assert "Loading" in captured.out
+        assert captured.out.endswith("\r")
+        # Only the main task should remain once the block exits
+        assert len(asyncio.all_tasks()) == 1
+
 class TestCLIIntegration:
     """Integration tests for CLI components"""
     
@@ -0,0 +1,70 @@
+# tests/interfaces/test_web_app.py
+
+from unittest.mock import patch
+
+import pytest
+
+from src.interfaces.web import app as web_app
+from src.interfaces.web.app import SessionStore
+
+class TestSessionStore:
+    """Test cases for the in-memory login session store"""
+
+    @pytest.fixture
+    def clock(self):
+        with patch.object(web_app.time, "monotonic", return_value=1000.0) as monotonic:
+            yield monotonic
+
+    def test_get_user_id_within_ttl(self, clock):
+        store = SessionStore(ttl_seconds=60, maxsize=10)
+        store.create("s1", "user_1")
+
+        clock.return_value = 1059.0
+        assert store.get_user_id("s1") == "user_1"
+
+    def test_session_expires_after_ttl(self, clock):
+        store = SessionStore(ttl_seconds=60, maxsize=10)
+        store.create("s1", "user_1")
+
+        clock.return_value = 1061.0
+        assert store.get_user_id("s1") is None
+        assert len(store) == 0
+
+    def test_create_purges_expired_sessions(self, clock):
+        store = SessionStore(ttl_seconds=60, maxsize=10)
+        store.create("old", "user_1")
+
+        clock.return_value = 1100.0
+        store.create("new", "user_2")
+
+        assert len(store) == 1
+        assert store.get_user_id("new") == "user_2"
+
+    def test_oldest_session_evicted_at_maxsize(self, clock):
+        store = SessionStore(ttl_seconds=60, maxsize=2)
+        store.create("s1", "user_1")
+        store.create("s2", "user_2")
+        store.create("s3", "user_3")
+
+        assert len(store) == 2
+        assert store.get_user_id("s1") is None
+        assert store.get_user_id("s2") == "user_2"
+        assert store.get_user_id("s3") == "user_3"
+
+    def test_get_user_id_after_discard(self, clock):
+        store = SessionStore(ttl_seconds=60, maxsize=10)
+        store.create("s1", "user_1")
+
+        store.discard("s1")
+
+        assert store.get_user_id("s1") is None
+        assert len(store) == 0
+
+    def test_discard_unknown_session_is_noop(self, clock):
+        store = SessionStore(ttl_seconds=60, maxsize=10)
+        store.create("s1", "user_1")
+
+        store.discard("missing")
+        store.discard(None)
+
+        assert store.get_user_id("s1") == "user_1"
@@ -0,0 +1,76 @@
+# tests/interfaces/test_web_app_backup.py
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.interfaces.web.app_backup import aggregate_positions
+
+def trade(symbol, side, amount, price, average_price=None):
+    return SimpleNamespace(symbol=symbol, side=side, amount=amount, price=price, average_price=average_price)
+
+class TestAggregatePositions:
+    """Test cases for positions built from recent trades"""
+
+    def test_mixed_trades_across_two_symbols(self):
+        symbols, sizes, avg_prices = aggregate_positions([
+            trade("BTC/USDT", "buy", 1.0, 40000.0),
+            trade("ETH/USDT", "buy", 2.0, 2000.0),
+            trade("BTC/USDT", "buy", 3.0, 44000.0),
+            trade("BTC/USDT", "sell", 1.5, 45000.0),
+            trade("ETH/USDT", "sell", 0.5, 2100.0)
+        ])
+
+        assert symbols == ["BTC/USDT", "ETH/USDT"]
+        assert sizes.tolist() == pytest.approx([2.5, 1.5])
+        # Average entry is weighted by bought volume; sells do not move it
+        assert avg_prices.tolist() == pytest.approx([43000.0, 2000.0])
+
+    def test_fully_sold_symbol_is_dropped(self):
+        symbols, sizes, avg_prices = aggregate_positions([
+            trade("BTC/USDT", "buy", 1.0, 40000.0),
+            trade("ETH/USDT", "buy", 2.0, 2000.0),
+            trade("ETH/USDT", "sell", 2.0, 2100.0)
+        ])
+
+        assert symbols == ["BTC/USDT"]
+        assert sizes.tolist() == pytest.approx([1.0])
+        assert avg_prices.tolist() == pytest.approx([40000.0])
+
+    def test_sell_only_input_has_no_positions(self):
+        symbols, sizes, avg_prices = aggregate_positions([
+            trade("BTC/USDT", "sell", 1.0, 40000.0),
+            trade("ETH/USDT", "sell", 2.0, 2000.0)
+        ])
+
+        assert symbols == []
+        assert len(sizes) == 0
+        assert len(avg_prices) == 0
+
+    def test_market_order_uses_average_price(self):
+        symbols, sizes, avg_prices = aggregate_positions([
+            trade("BTC/USDT", "buy", 1.0, None, average_price=41000.0),
+            trade("BTC/USDT", "buy", 1.0, 40000.0, average_price=39000.0)
+        ])
+
+        assert symbols == ["BTC/USDT"]
+        assert sizes.tolist() == pytest.approx([2.0])
+        assert avg_prices.tolist() == pytest.approx([40000.0])
+
+    def test_market_order_without_price_is_skipped(self):
+        symbols, sizes, avg_prices = aggregate_positions([
+            trade("BTC/USDT", "buy", 1.0, 40000.0),
+            trade("BTC/USDT", "buy", 5.0, None),
+            trade("ETH/USDT", "buy", 2.0, None)
+        ])
+
+        assert symbols == ["BTC/USDT"]
+        assert sizes.tolist() == pytest.approx([1.0])
+        assert avg_prices.tolist() == pytest.approx([40000.0])
+
+    def test_no_priced_trades_has_no_positions(self):
+        symbols, sizes, avg_prices = aggregate_positions([trade("BTC/USDT", "buy", 1.0, None)])
+
+        assert symbols == []
+        assert len(sizes) == 0
+        assert len(avg_prices) == 0